@@ -8,15 +8,266 @@ Supports configuration files and additional migration features.
 """
 
 import xmlrpc.client
+import http.client
+import http.cookies
+import urllib.parse
 import json
 import logging
+import logging.handlers
 import sys
 import os
+import copy
+import functools
+import collections
+import itertools
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Callable
 import argparse
 import getpass
+import queue
 import shutil
+import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# SSL context that ignores certificate verification for HTTPS connections;
+# built once and shared by every transport, see create_transport
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+
+# Parsed configuration files keyed by (path, mtime, size), see load_config
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# Compact JSON for RPC bodies and snapshots, without the default padding spaces
+_JSON_SEPARATORS = (',', ':')
+
+# Start of the snapshot lines holding asset batches, see save_snapshot
+_SNAPSHOT_ASSETS_PREFIX = b'["assets",'
+
+# Optional website fields, fetched and migrated depending on migration_options
+_SOCIAL_FIELDS = [
+    'social_twitter', 'social_facebook', 'social_github',
+    'social_linkedin', 'social_youtube', 'social_instagram',
+]
+_BRANDING_FIELDS = ['favicon', 'logo']
+
+# Characters replaced by dashes when deriving a page URL from its name
+_SLUG_TBL = str.maketrans({' ': '-', '_': '-'})
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most ``size`` items from ``items``."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def prefetch(items: Iterable[Any], size: int) -> Iterator[Any]:
+    """
+    Pull items from ``items`` on a background thread, ahead of the consumer.
+    
+    The thread starts right away and buffers at most ``size`` items, so slow
+    reads overlap with whatever the caller does in the meantime. Exceptions
+    raised while producing are re-raised to the consumer. Closing the returned
+    iterator early stops the thread.
+    """
+    buffer = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    done = object()
+    
+    def put(entry):
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((done, e))
+            return
+        put((done, None))
+    
+    def consume():
+        try:
+            while True:
+                item, error = buffer.get()
+                if item is done:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            stop.set()
+    
+    threading.Thread(target=produce, daemon=True).start()
+    return consume()
+
+
+class JsonRpcProxy:
+    """
+    Client for the /jsonrpc endpoint of an Odoo instance.
+    
+    It offers the same ``execute_kw`` call as the XML-RPC object proxy, so the two
+    are interchangeable. JSON is cheaper to encode and parse than XML-RPC for the
+    large arch and datas payloads. The HTTP(S) connection is kept open between
+    calls. Like ServerProxy it is not thread-safe.
+    """
+    
+    def __init__(self, url: str, service: str = 'object'):
+        """
+        Initialize the proxy.
+        
+        Args:
+            url: Base URL of the Odoo instance
+            service: JSON-RPC service to call, e.g. 'object' or 'common'
+        """
+        parts = urllib.parse.urlsplit(url)
+        self.url = url
+        self.host = parts.netloc
+        self.base_path = parts.path.rstrip('/')
+        self.https = parts.scheme == 'https'
+        self.service = service
+        self.connection = None
+        self.request_id = 0
+        
+        # Request envelope reused for every call, only the id and params change;
+        # safe because a proxy is only ever used by one thread
+        self.envelope = {'jsonrpc': '2.0', 'method': 'call', 'id': 0, 'params': None}
+    
+    def make_connection(self) -> http.client.HTTPConnection:
+        """Return the kept-alive connection, opening it if needed."""
+        if self.connection is None:
+            if self.https:
+                self.connection = http.client.HTTPSConnection(self.host, context=_SSL_CTX)
+            else:
+                self.connection = http.client.HTTPConnection(self.host)
+        return self.connection
+    
+    def close(self):
+        """Close the underlying connection."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+    
+    def post(self, path: str, params: Dict[str, Any],
+             headers: Optional[Dict[str, str]] = None) -> tuple:
+        """
+        Send a JSON-RPC request to a path of the instance.
+        
+        Errors reported by the server are raised as xmlrpc.client.Fault, the same
+        as with the XML-RPC proxies.
+        
+        Returns:
+            Tuple of the call's result and the HTTP response
+        """
+        self.request_id += 1
+        self.envelope['id'] = self.request_id
+        self.envelope['params'] = params
+        body = json.dumps(self.envelope, separators=_JSON_SEPARATORS, ensure_ascii=False).encode()
+        # Don't keep the last payload alive until the next call
+        self.envelope['params'] = None
+        headers = {'Content-Type': 'application/json', **(headers or {})}
+        
+        # Retry once if the server closed the idle connection, like xmlrpc.client does
+        for attempt in range(2):
+            connection = self.make_connection()
+            try:
+                connection.request('POST', self.base_path + path, body, headers)
+                response = connection.getresponse()
+                payload = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    ConnectionAbortedError, BrokenPipeError):
+                self.close()
+                if attempt:
+                    raise
+            except Exception:
+                # Any other failure, e.g. a bad status line or an SSL error, leaves
+                # the connection midway through a request, so it can't be reused
+                self.close()
+                raise
+        
+        if response.status != 200:
+            raise xmlrpc.client.ProtocolError(self.url + path, response.status,
+                                              response.reason, dict(response.getheaders()))
+        
+        # json.loads decodes the UTF-8 bytes itself, no intermediate str is needed
+        result = json.loads(payload)
+        if result.get('error'):
+            error = result['error']
+            message = (error.get('data') or {}).get('message') or error.get('message', '')
+            raise xmlrpc.client.Fault(error.get('code', 0), message)
+        return result.get('result'), response
+    
+    def call(self, method: str, *args) -> Any:
+        """Call a method of the proxy's service."""
+        result, _ = self.post('/jsonrpc', {'service': self.service, 'method': method, 'args': list(args)})
+        return result
+    
+    def authenticate_session(self, db: str, login: str, password: str) -> tuple:
+        """
+        Log in through /web/session/authenticate.
+        
+        Returns:
+            Tuple of the user ID and the ``session_id`` cookie of the new session
+        """
+        result, response = self.post('/web/session/authenticate',
+                                     {'db': db, 'login': login, 'password': password})
+        cookies = http.cookies.SimpleCookie()
+        for header in response.msg.get_all('Set-Cookie') or []:
+            cookies.load(header)
+        
+        if not result or not result.get('uid') or 'session_id' not in cookies:
+            raise Exception(f"Authentication failed for {self.url}")
+        return result['uid'], cookies['session_id'].value
+    
+    def execute_kw(self, db: str, uid: int, password: str, model: str, method: str,
+                   args: List[Any], kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        """Call a model method, with the same arguments as the XML-RPC execute_kw."""
+        return self.call('execute_kw', db, uid, password, model, method, args, kwargs or {})
+
+
+class OdooSessionProxy(JsonRpcProxy):
+    """
+    Client for the /web/dataset/call_kw endpoint of an Odoo instance.
+    
+    Calls are authenticated by the cookie of a web session opened once with
+    JsonRpcProxy.authenticate_session, so the server doesn't check the password
+    again on every request and the credentials aren't resent with each call.
+    """
+    
+    def __init__(self, url: str, session_id: str):
+        """
+        Initialize the proxy.
+        
+        Args:
+            url: Base URL of the Odoo instance
+            session_id: Value of the ``session_id`` cookie of an authenticated session
+        """
+        super().__init__(url)
+        self.session_id = session_id
+    
+    def execute_kw(self, db: str, uid: int, password: str, model: str, method: str,
+                   args: List[Any], kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        """Call a model method; db, uid and password are implied by the session."""
+        result, _ = self.post(
+            f'/web/dataset/call_kw/{model}/{method}',
+            {'model': model, 'method': method, 'args': args, 'kwargs': kwargs or {}},
+            {'Cookie': f'session_id={self.session_id}'}
+        )
+        return result
 
 
 class EnhancedOdooWebsiteMigrator:
@@ -28,14 +279,17 @@ class EnhancedOdooWebsiteMigrator:
         
         Args:
             config_file: Path to configuration JSON file
-            **kwargs: Direct connection parameters (overrides config file)
+            **kwargs: Direct connection parameters (overrides config file); the
+                migration_options given are merged into those of the config file
         """
         self.config = self.load_config(config_file) if config_file else {}
         
         # Override config with direct parameters
         for key, value in kwargs.items():
             if value is not None:
-                if '.' in key:
+                if key == 'migration_options':
+                    self.config.setdefault('migration_options', {}).update(value)
+                elif '.' in key:
                     section, param = key.split('.', 1)
                     if section not in self.config:
                         self.config[section] = {}
@@ -44,32 +298,54 @@ class EnhancedOdooWebsiteMigrator:
                     self.config[key] = value
         
         # Initialize connection parameters
-        self.source_url = self.config.get('source', {}).get('url', '').rstrip('/')
-        self.source_db = self.config.get('source', {}).get('database', '')
-        self.source_username = self.config.get('source', {}).get('username', '')
-        self.source_password = self.config.get('source', {}).get('password', '')
+        source = self.config.get('source', {})
+        self.source_url = source.get('url', '').rstrip('/')
+        self.source_db = source.get('database', '')
+        self.source_username = source.get('username', '')
+        self.source_password = source.get('password') or os.environ.get('ODOO_SOURCE_PASSWORD', '')
         
-        self.target_url = self.config.get('target', {}).get('url', '').rstrip('/')
-        self.target_db = self.config.get('target', {}).get('database', '')
-        self.target_username = self.config.get('target', {}).get('username', '')
-        self.target_password = self.config.get('target', {}).get('password', '')
+        target = self.config.get('target', {})
+        self.target_url = target.get('url', '').rstrip('/')
+        self.target_db = target.get('database', '')
+        self.target_username = target.get('username', '')
+        self.target_password = target.get('password') or os.environ.get('ODOO_TARGET_PASSWORD', '')
         
         # Migration options
         self.migration_options = self.config.get('migration_options', {})
         
-        # Initialize XML-RPC connections
+        # Initialize XML-RPC connections; the object proxies are kept per thread
+        # (see get_models_proxy) so they can be used from worker threads
+        self._local = threading.local()
+        
         self.source_common = None
         self.source_models = None
         self.source_uid = None
+        self.source_session_id = None
         
         self.target_common = None
         self.target_models = None
         self.target_uid = None
+        self.target_session_id = None
+        
+        # Source builder views by name, filled in by get_website_pages
+        self._view_index = {}
+        
+        # Source views read so far by ID, see get_source_views
+        self._view_cache = {}
+        
+        # Target modules looked up so far by name, see get_target_modules
+        self._module_cache = {}
+        
+        # Timestamp of this run, shared by the log and report file names so they match
+        self._run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Setup logging
         self.setup_logging()
         
-        # Migration statistics
+        # Migration statistics; guarded by a lock where worker threads update them.
+        # Every error goes to the log file; here they are counted per category and
+        # only the most recent ones are kept
+        self._stats_lock = threading.Lock()
         self.migration_stats = {
             'websites_migrated': 0,
             'pages_migrated': 0,
@@ -77,27 +353,83 @@ class EnhancedOdooWebsiteMigrator:
             'themes_migrated': 0,
             'snippets_migrated': 0,
             'assets_migrated': 0,
-            'errors': []
+            'errors_count': 0,
+            'errors_by_category': collections.Counter(),
+            'errors': collections.deque(maxlen=self.migration_options.get('max_reported_errors', 100))
         }
     
+    def record_error(self, error_msg: str, category: str):
+        """
+        Count an error and remember it for the report.
+        
+        The caller is expected to have logged the error already. Safe to call from
+        worker threads.
+        
+        Args:
+            error_msg: Error message for the report
+            category: What the error is about, e.g. 'pages' or 'assets'
+        """
+        with self._stats_lock:
+            self.migration_stats['errors_count'] += 1
+            self.migration_stats['errors_by_category'][category] += 1
+            self.migration_stats['errors'].append(error_msg)
+    
     def load_config(self, config_file: str) -> Dict[str, Any]:
-        """Load configuration from JSON file."""
+        """
+        Load configuration from JSON file.
+        
+        Parsed files are cached for the lifetime of the process and reused as long
+        as their modification time and size are unchanged. Callers get a deep copy
+        so they are free to modify it.
+        """
         try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            stat = os.stat(config_file)
+            cache_key = (os.path.abspath(config_file), stat.st_mtime_ns, stat.st_size)
+            if cache_key not in _CONFIG_CACHE:
+                # json.loads decodes bytes itself, skipping the text-mode wrapper
+                with open(config_file, 'rb') as f:
+                    _CONFIG_CACHE[cache_key] = json.loads(f.read())
+            return copy.deepcopy(_CONFIG_CACHE[cache_key])
         except Exception as e:
             raise Exception(f"Failed to load configuration file {config_file}: {str(e)}")
     
     def setup_logging(self):
-        """Setup logging configuration."""
-        log_filename = f'migration_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+        """
+        Setup logging configuration.
+        
+        Logging calls only put the record on a queue; a background listener
+        thread formats it and writes it to the log file and the console, so
+        worker threads never wait on the disk or the terminal. Records for the
+        log file are additionally buffered and written in groups of up to 1000,
+        or right away when an error is logged.
+        """
+        log_filename = f'migration_{self._run_ts}.log'
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_filename)
+        file_handler.setFormatter(formatter)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue,
+            logging.handlers.MemoryHandler(capacity=1000, flushLevel=logging.ERROR, target=file_handler),
+            console_handler
+        )
+        self._log_listener.start()
+        
+        # Drop the queue handler of an earlier migrator in this process, whose
+        # listener is no longer running; basicConfig does nothing otherwise
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root_logger.removeHandler(handler)
+        
+        # The queued records are formatted by the listener's handlers
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_filename),
-                logging.StreamHandler(sys.stdout)
-            ]
+            format='%(message)s',
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
         self.logger = logging.getLogger(__name__)
     
@@ -116,73 +448,269 @@ class EnhancedOdooWebsiteMigrator:
         if missing_params:
             raise ValueError(f"Missing required parameters: {', '.join(missing_params)}")
     
-    def connect_to_odoo(self, url: str, db: str, username: str, password: str) -> tuple:
-        """Connect to an Odoo instance using XML-RPC."""
+    @property
+    def source_models(self):
+        """Object proxy for the source instance (one per thread)."""
+        return self.get_models_proxy('source')
+    
+    @source_models.setter
+    def source_models(self, proxy):
+        self._local.source_models = proxy
+        self._local.methods = {}
+    
+    @property
+    def target_models(self):
+        """Object proxy for the target instance (one per thread)."""
+        return self.get_models_proxy('target')
+    
+    @target_models.setter
+    def target_models(self, proxy):
+        self._local.target_models = proxy
+        self._local.methods = {}
+    
+    def get_models_proxy(self, side: str):
+        """
+        Return the calling thread's object proxy for the 'source' or 'target' side.
+        
+        A proxy holds a single HTTP connection and must not be shared between
+        threads, so worker threads lazily open their own proxy to the same URL.
+        """
+        proxy = getattr(self._local, f'{side}_models', None)
+        if proxy is None:
+            proxy = self.create_models_proxy(getattr(self, f'{side}_url'), self.get_protocol(side),
+                                             session_id=getattr(self, f'{side}_session_id'))
+            setattr(self._local, f'{side}_models', proxy)
+        return proxy
+    
+    def model_method(self, side: str, model: str, method: str) -> Callable[..., Any]:
+        """
+        Return a callable for one model method on the 'source' or 'target' side.
+        
+        The database, user, password, model and method are bound once with
+        ``functools.partial``, so call sites only pass the per-call arguments,
+        e.g. ``self.model_method('target', 'website.menu', 'create')([vals])``.
+        The callables wrap the thread's own proxy and are cached per thread.
+        """
+        methods = getattr(self._local, 'methods', None)
+        if methods is None:
+            methods = self._local.methods = {}
+        key = (side, model, method)
+        if key not in methods:
+            methods[key] = functools.partial(
+                self.get_models_proxy(side).execute_kw,
+                getattr(self, f'{side}_db'), getattr(self, f'{side}_uid'), getattr(self, f'{side}_password'),
+                model, method
+            )
+        return methods[key]
+    
+    def get_protocol(self, side: str) -> str:
+        """
+        Return the protocol used for object calls on the 'source' or 'target' side.
+        
+        The ``<side>_protocol`` migration option selects 'jsonrpc', 'xmlrpc' or
+        'session' (JSON-RPC in a web session), and defaults to 'jsonrpc'.
+        """
+        return self.migration_options.get(f'{side}_protocol', 'jsonrpc')
+    
+    def create_models_proxy(self, url: str, protocol: str,
+                            transport: Optional[xmlrpc.client.Transport] = None,
+                            session_id: Optional[str] = None):
+        """Create an object proxy for an Odoo instance speaking the given protocol."""
+        if protocol == 'session':
+            return OdooSessionProxy(url, session_id)
+        if protocol == 'jsonrpc':
+            return JsonRpcProxy(url)
+        return self.create_server_proxy(url, 'object', transport)
+    
+    def create_transport(self, url: str) -> xmlrpc.client.Transport:
+        """
+        Create an XML-RPC transport for an Odoo instance.
+        
+        A transport keeps its HTTP(S) connection open between requests, so proxies
+        that share one also share a single TCP connection and TLS handshake.
+        """
+        if url.startswith('https://'):
+            # Create transport with the shared unverified SSL context
+            return xmlrpc.client.SafeTransport(context=_SSL_CTX)
+        return xmlrpc.client.Transport()
+    
+    def create_server_proxy(self, url: str, endpoint: str,
+                            transport: Optional[xmlrpc.client.Transport] = None) -> xmlrpc.client.ServerProxy:
+        """Create an XML-RPC proxy for one of the /xmlrpc/2 endpoints of an Odoo instance."""
+        if transport is None:
+            transport = self.create_transport(url)
+        return xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/{endpoint}', transport=transport)
+    
+    def connect_to_odoo(self, url: str, db: str, username: str, password: str,
+                        protocol: str = 'jsonrpc') -> tuple:
+        """
+        Connect to an Odoo instance.
+        
+        With the 'session' protocol the user logs in to a web session, otherwise
+        the credentials are checked by the common service over the same protocol
+        as the data calls.
+        """
         try:
-            # Create SSL context that ignores certificate verification for HTTPS connections
-            import ssl
-            if url.startswith('https://'):
-                # Create SSL context that doesn't verify certificates
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                
-                # Create transport with custom SSL context
-                import xmlrpc.client
-                transport = xmlrpc.client.SafeTransport(context=ssl_context)
-                common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common', transport=transport)
-                models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object', transport=transport)
+            if protocol == 'xmlrpc':
+                # Both endpoints share one transport, and with it one kept-alive connection
+                transport = self.create_transport(url)
+                common = self.create_server_proxy(url, 'common', transport)
+                models = self.create_models_proxy(url, protocol, transport)
+                uid = common.authenticate(db, username, password, {})
             else:
-                common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common')
-                models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object')
-            
-            uid = common.authenticate(db, username, password, {})
+                common = JsonRpcProxy(url, 'common')
+                if protocol == 'session':
+                    uid, session_id = common.authenticate_session(db, username, password)
+                    models = self.create_models_proxy(url, protocol, session_id=session_id)
+                else:
+                    models = self.create_models_proxy(url, protocol)
+                    uid = common.call('authenticate', db, username, password, {})
             
             if not uid:
                 raise Exception(f"Authentication failed for {url}")
             
-            self.logger.info(f"Successfully connected to {url}")
+            self.logger.info("Successfully connected to %s", url)
             return common, models, uid
             
         except Exception as e:
-            self.logger.error(f"Failed to connect to {url}: {str(e)}")
+            self.logger.error("Failed to connect to %s: %s", url, e)
             raise
     
+    def prompt_password(self, side: str):
+        """
+        Ask for the password of the 'source' or 'target' side if none was given.
+        
+        Prompting is left until the connection is made, so invalid parameters are
+        reported before the user is asked for anything.
+        """
+        if not getattr(self, f'{side}_password'):
+            setattr(self, f'{side}_password', getpass.getpass(f'{side.capitalize()} password: '))
+    
     def connect_to_source(self):
         """Connect to the source Odoo 16 instance."""
+        self.prompt_password('source')
         self.logger.info("Connecting to source Odoo 16 instance...")
         self.source_common, self.source_models, self.source_uid = self.connect_to_odoo(
-            self.source_url, self.source_db, self.source_username, self.source_password
+            self.source_url, self.source_db, self.source_username, self.source_password,
+            self.get_protocol('source')
         )
+        self.source_session_id = getattr(self.source_models, 'session_id', None)
     
     def connect_to_target(self):
         """Connect to the target Odoo 18 instance."""
+        self.prompt_password('target')
         self.logger.info("Connecting to target Odoo 18 instance...")
         self.target_common, self.target_models, self.target_uid = self.connect_to_odoo(
-            self.target_url, self.target_db, self.target_username, self.target_password
+            self.target_url, self.target_db, self.target_username, self.target_password,
+            self.get_protocol('target')
         )
+        self.target_session_id = getattr(self.target_models, 'session_id', None)
     
-    def get_website_data(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Retrieve all website data from the source instance."""
-        data = {}
+    def get_website_data(self) -> Dict[str, Any]:
+        """
+        Retrieve all website data from the source instance.
         
-        if self.migration_options.get('migrate_websites', True):
-            data['websites'] = self.get_websites()
+        The fetches are independent and spend nearly all their time waiting on the
+        network, so they run concurrently and the total wait is roughly that of the
+        slowest one instead of the sum of all of them. Assets are not fetched here:
+        ``data['assets']`` is a generator that pages through them as they are
+        migrated.
         
-        if self.migration_options.get('migrate_pages', True):
-            data['pages'] = self.get_website_pages()
+        With the ``use_snapshot`` option the data is loaded from a snapshot file
+        instead, and with ``save_snapshot`` freshly fetched data is written to one.
+        """
+        snapshot_file = self.migration_options.get('use_snapshot')
+        if snapshot_file:
+            self.logger.info("Loading source data from snapshot %s...", snapshot_file)
+            data = self.load_snapshot(snapshot_file)
+            return {
+                key: value for key, value in data.items()
+                if self.migration_options.get(f'migrate_{key}', True)
+            }
         
-        if self.migration_options.get('migrate_menus', True):
-            data['menus'] = self.get_website_menus()
+        fetchers = [
+            ('websites', 'migrate_websites', self.get_websites),
+            ('pages', 'migrate_pages', self.get_website_pages),
+            ('menus', 'migrate_menus', self.get_website_menus),
+            ('themes', 'migrate_themes', self.get_website_themes),
+        ]
+        fetchers = [
+            (key, fetch) for key, option, fetch in fetchers
+            if self.migration_options.get(option, True)
+        ]
+        
+        data = {}
         
-        if self.migration_options.get('migrate_themes', True):
-            data['themes'] = self.get_website_themes()
+        if fetchers:
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = [(key, executor.submit(fetch)) for key, fetch in fetchers]
+                for key, future in futures:
+                    data[key] = future.result()
         
         if self.migration_options.get('migrate_assets', True):
-            data['assets'] = self.get_website_assets()
+            data['assets'] = self.iter_website_assets()
+        
+        if self.migration_options.get('save_snapshot', False):
+            data = self.save_snapshot(data)
         
         return data
     
+    def save_snapshot(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Save fetched source data so later runs can skip the source RPCs.
+        
+        The snapshot is a JSON Lines file with one ``[key, records]`` entry per data
+        type and one entry per asset batch, so assets are never all held in memory.
+        Writing consumes the assets generator, so the returned data streams the
+        assets back from the snapshot.
+        
+        Returns:
+            The same data, with assets read from the snapshot file
+        """
+        snapshot_file = f'snapshot_{self.source_db}_{datetime.now().strftime("%Y%m%d")}.json'
+        
+        with open(snapshot_file, 'w') as f:
+            for key, value in data.items():
+                if key == 'assets':
+                    # Always write one line, so an empty asset list survives the round-trip
+                    f.write(json.dumps([key, []], separators=_JSON_SEPARATORS) + '\n')
+                    for batch in value:
+                        # Snapshots carry the payloads so they can be migrated without the source
+                        self.read_asset_datas(batch)
+                        f.write(json.dumps([key, batch], separators=_JSON_SEPARATORS) + '\n')
+                else:
+                    f.write(json.dumps([key, value], separators=_JSON_SEPARATORS) + '\n')
+        
+        self.logger.info("Source data snapshot saved to: %s", snapshot_file)
+        return self.load_snapshot(snapshot_file)
+    
+    def load_snapshot(self, snapshot_file: str) -> Dict[str, Any]:
+        """Load source data saved by save_snapshot."""
+        data = {}
+        
+        with open(snapshot_file, 'rb') as f:
+            for line in f:
+                # Asset batches are streamed by iter_snapshot_assets, don't parse them here
+                if line.startswith(_SNAPSHOT_ASSETS_PREFIX):
+                    data['assets'] = None
+                    continue
+                key, records = json.loads(line)
+                data[key] = records
+        
+        if 'assets' in data:
+            data['assets'] = self.iter_snapshot_assets(snapshot_file)
+        
+        return data
+    
+    def iter_snapshot_assets(self, snapshot_file: str) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the asset batches stored in a snapshot file."""
+        with open(snapshot_file, 'rb') as f:
+            for line in f:
+                if line.startswith(_SNAPSHOT_ASSETS_PREFIX):
+                    _, batch = json.loads(line)
+                    if batch:
+                        yield batch
+    
     def get_website_pages(self) -> List[Dict[str, Any]]:
         """Retrieve all website pages from the source instance."""
         try:
@@ -197,14 +725,19 @@ class EnhancedOdooWebsiteMigrator:
                     'fields': ['name', 'key', 'arch_db', 'arch', 'id']
                 }
             )
-            self.logger.info(f"Found {len(builder_pages)} website builder pages")
+            self.logger.info("Found %s website builder pages", len(builder_pages))
+            
+            # Keep the views around so builder content can be looked up without re-querying
+            self._view_index = {}
+            for builder_page in builder_pages:
+                self._view_index.setdefault(builder_page['name'], builder_page)
             
             # Convert builder pages to page format
             pages = []
             for builder_page in builder_pages:
                 page_name = builder_page['name']
                 # Extract URL from key or create one
-                url = f'/{page_name.lower().replace(" ", "-").replace("_", "-")}'
+                url = f'/{page_name.lower().translate(_SLUG_TBL)}'
                 if 'website.page.' in builder_page['key']:
                     url_part = builder_page['key'].replace('website.page.', '')
                     url = f'/{url_part}'
@@ -236,20 +769,22 @@ class EnhancedOdooWebsiteMigrator:
                 )
                 
                 # Add regular pages that don't conflict with builder pages
+                page_names = {p['name'] for p in pages}
                 for regular_page in regular_pages:
-                    existing_page = next((p for p in pages if p['name'] == regular_page['name']), None)
-                    if not existing_page:
-                        regular_page['is_builder_page'] = False
-                        pages.append(regular_page)
+                    if regular_page['name'] in page_names:
+                        continue
+                    regular_page['is_builder_page'] = False
+                    pages.append(regular_page)
+                    page_names.add(regular_page['name'])
                         
             except Exception as e:
-                self.logger.warning(f"Could not retrieve regular website pages: {str(e)}")
+                self.logger.warning("Could not retrieve regular website pages: %s", e)
             
-            self.logger.info(f"Found {len(pages)} total website pages")
+            self.logger.info("Found %s total website pages", len(pages))
             return pages
         except Exception as e:
-            self.logger.error(f"Error retrieving website pages: {str(e)}")
-            self.migration_stats['errors'].append(f"Website pages: {str(e)}")
+            self.logger.error("Error retrieving website pages: %s", e)
+            self.record_error(f"Website pages: {str(e)}", 'pages')
             return []
     
     def get_website_menus(self) -> List[Dict[str, Any]]:
@@ -262,16 +797,16 @@ class EnhancedOdooWebsiteMigrator:
                 [[]],
                 {
                     'fields': [
-                        'name', 'url', 'page_id', 'parent_id', 'sequence',
-                        'website_id', 'is_visible', 'is_mega_menu'
+                        'name', 'url', 'parent_id', 'sequence',
+                        'is_visible', 'is_mega_menu'
                     ]
                 }
             )
-            self.logger.info(f"Found {len(menus)} website menus")
+            self.logger.info("Found %s website menus", len(menus))
             return menus
         except Exception as e:
-            self.logger.error(f"Error retrieving website menus: {str(e)}")
-            self.migration_stats['errors'].append(f"Website menus: {str(e)}")
+            self.logger.error("Error retrieving website menus: %s", e)
+            self.record_error(f"Website menus: {str(e)}", 'menus')
             return []
     
     def get_website_themes(self) -> List[Dict[str, Any]]:
@@ -283,63 +818,278 @@ class EnhancedOdooWebsiteMigrator:
                 'ir.module.module', 'search_read',
                 [[('name', 'like', 'theme_'), ('state', '=', 'installed')]],
                 {
-                    'fields': ['name', 'shortdesc', 'description', 'state']
+                    'fields': ['name']
                 }
             )
-            self.logger.info(f"Found {len(themes)} website themes")
+            self.logger.info("Found %s website themes", len(themes))
             return themes
         except Exception as e:
-            self.logger.error(f"Error retrieving website themes: {str(e)}")
-            self.migration_stats['errors'].append(f"Website themes: {str(e)}")
+            self.logger.error("Error retrieving website themes: %s", e)
+            self.record_error(f"Website themes: {str(e)}", 'themes')
             return []
     
-    def get_website_assets(self) -> List[Dict[str, Any]]:
-        """Retrieve website assets from the source instance."""
+    def iter_website_assets(self, batch_size: int = 200) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Retrieve website asset metadata from the source instance in batches.
+        
+        Only metadata is fetched here; the payloads (``datas``) are read later by
+        read_asset_datas, and only for assets that actually get migrated. The
+        matching IDs are searched once and read one batch at a time, so only a
+        single batch is held in memory and a failing read is retried per record.
+        With the ``since`` option only attachments created on or after that date
+        are read.
+        
+        Args:
+            batch_size: Number of attachments fetched per call
+            
+        Yields:
+            Lists of at most ``batch_size`` attachment dicts, without ``datas``
+        """
+        # Restrict the search to attachments that belong to the website, so the
+        # server can use the res_model index instead of scanning every attachment
+        domain = [
+            ('mimetype', 'in', ['text/css', 'application/javascript', 'image/png', 'image/jpeg', 'image/gif', 'image/svg+xml']),
+            '|', ('res_model', 'in', ['website', 'ir.ui.view', 'website.page']), ('url', '=like', '/web/image/%'),
+        ]
+        
+        # Only pick up attachments created since the given date on incremental runs
+        since = self.migration_options.get('since')
+        if since:
+            domain.append(('create_date', '>=', since))
+        
         try:
             self.logger.info("Retrieving website assets from source...")
-            assets = self.source_models.execute_kw(
+            
+            # Search the IDs first and read them in slices, so a failing read only
+            # costs its own slice
+            asset_ids = self.source_models.execute_kw(
                 self.source_db, self.source_uid, self.source_password,
-                'ir.attachment', 'search_read',
-                [[('mimetype', 'in', ['text/css', 'application/javascript', 'image/png', 'image/jpeg', 'image/gif', 'image/svg+xml'])]],
-                {
-                    'fields': ['name', 'datas', 'mimetype', 'url', 'res_model', 'res_id']
-                }
+                'ir.attachment', 'search',
+                [domain],
+                {'order': 'id'}
             )
-            self.logger.info(f"Found {len(assets)} website assets")
-            return assets
+            self.logger.info("Found %s website assets", len(asset_ids))
+            
+            for batch in chunked(asset_ids, batch_size):
+                assets = self.read_records(
+                    'ir.attachment', batch,
+                    ['name', 'checksum', 'file_size', 'mimetype', 'url', 'res_model', 'res_id']
+                )
+                if assets:
+                    yield assets
         except Exception as e:
-            self.logger.error(f"Error retrieving website assets: {str(e)}")
-            self.migration_stats['errors'].append(f"Website assets: {str(e)}")
-            return []
+            self.logger.error("Error retrieving website assets: %s", e)
+            self.record_error(f"Website assets: {str(e)}", 'assets')
+    
+    def read_records(self, model: str, ids: List[int], fields: List[str]) -> List[Dict[str, Any]]:
+        """
+        Read records from the source instance in a single call.
+        
+        When the call fails the records are retried one at a time, so one broken
+        record doesn't take the rest of the slice down with it. Records that still
+        can't be read are reported as errors and left out.
+        
+        Args:
+            model: Source model name
+            ids: IDs of the records to read
+            fields: Fields to read
+            
+        Returns:
+            The records that could be read
+        """
+        try:
+            return self.model_method('source', model, 'read')([ids], {'fields': fields})
+        except Exception as e:
+            if len(ids) == 1:
+                error_msg = f"Error reading {model} record {ids[0]}: {str(e)}"
+                self.logger.error(error_msg)
+                self.record_error(error_msg, 'source reads')
+                return []
+            self.logger.warning("Reading %s %s records failed, retrying one by one: %s", len(ids), model, e)
+        
+        records = []
+        for record_id in ids:
+            records.extend(self.read_records(model, [record_id], fields))
+        return records
+    
+    def read_asset_datas(self, assets: List[Dict[str, Any]]):
+        """
+        Fill in the base64 payload of the given assets from the source instance.
+        
+        Assets that already carry ``datas`` (e.g. loaded from a snapshot) are left
+        alone; the others are read in a single call. Assets with the same checksum
+        have the same content, so it is only read once and shared between them.
+        Assets whose payload could not be read are left without ``datas``.
+        """
+        missing = [asset for asset in assets if 'datas' not in asset]
+        if not missing:
+            return
+        
+        # One asset to read per distinct content; assets without a checksum are read on their own
+        readers = {asset.get('checksum') or ('id', asset['id']): asset['id'] for asset in missing}
+        records = self.read_records('ir.attachment', list(readers.values()), ['datas'])
+        datas_by_id = {record['id']: record['datas'] for record in records}
+        
+        for asset in missing:
+            reader_id = readers[asset.get('checksum') or ('id', asset['id'])]
+            if reader_id in datas_by_id:
+                asset['datas'] = datas_by_id[reader_id]
     
     def get_websites(self) -> List[Dict[str, Any]]:
         """Retrieve all websites from the source instance."""
         try:
             self.logger.info("Retrieving websites from source...")
+            
+            # Only fetch the optional fields that are going to be migrated; favicon
+            # and logo are base64 images and make up most of the payload
+            fields = [
+                'name', 'domain',
+                'google_analytics_key', 'google_maps_api_key',
+                'cdn_activated', 'cdn_url', 'cdn_filters', 'theme_id'
+            ]
+            if self.migration_options.get('migrate_social', True):
+                fields += _SOCIAL_FIELDS
+            if self.migration_options.get('migrate_branding', False):
+                fields += _BRANDING_FIELDS
+            
             websites = self.source_models.execute_kw(
                 self.source_db, self.source_uid, self.source_password,
                 'website', 'search_read',
                 [[]],
-                {
-                    'fields': [
-                        'name', 'domain', 'company_id', 'default_lang_id',
-                        'social_twitter', 'social_facebook', 'social_github',
-                        'social_linkedin', 'social_youtube', 'social_instagram',
-                        'google_analytics_key', 'google_maps_api_key',
-                        'cdn_activated', 'cdn_url', 'cdn_filters',
-                        'favicon', 'logo', 'theme_id'
-                    ]
-                }
+                {'fields': fields}
             )
-            self.logger.info(f"Found {len(websites)} websites")
+            self.logger.info("Found %s websites", len(websites))
             return websites
         except Exception as e:
-            self.logger.error(f"Error retrieving websites: {str(e)}")
-            self.migration_stats['errors'].append(f"Websites: {str(e)}")
+            self.logger.error("Error retrieving websites: %s", e)
+            self.record_error(f"Websites: {str(e)}", 'websites')
             return []
     
-    def migrate_website_data(self, data: Dict[str, List[Dict[str, Any]]]):
-        """Migrate all website data to the target instance."""
+    def get_existing_values(self, model: str, field: str, values: Iterable[Any]) -> set:
+        """
+        Return the subset of ``values`` already present in ``field`` of a target model.
+        
+        This replaces one existence probe per record with a single search_read per
+        thousand values.
+        """
+        return {record[field] for record in self.get_existing_records(model, field, values, [field])}
+    
+    def get_existing_records(self, model: str, field: str, values: Iterable[Any],
+                             fields: List[str]) -> List[Dict[str, Any]]:
+        """
+        Read the target records whose ``field`` is one of ``values``.
+        
+        Args:
+            model: Target model name
+            field: Field to match against
+            values: Values to look up; duplicates are only sent once
+            fields: Fields to read from the matching records
+            
+        Returns:
+            The matching records, fetched with one search_read per thousand values
+        """
+        records = []
+        search_read = self.model_method('target', model, 'search_read')
+        
+        for batch in chunked(dict.fromkeys(values), 1000):
+            records.extend(search_read([[(field, 'in', batch)]], {'fields': fields}))
+        
+        return records
+    
+    def create_records(self, model: str, vals_list: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Create records in the target instance in batches.
+        
+        Odoo's create accepts a list of value dicts, so every batch of
+        ``batch_size`` records costs a single round-trip. When a batch fails its
+        records are retried one at a time, so one bad record doesn't take the
+        rest of the batch down with it.
+        
+        Args:
+            model: Target model name
+            vals_list: Values for the records to create
+            
+        Returns:
+            One entry per value dict: the new record ID, or the exception raised
+            while creating that record
+        """
+        batch_size = self.migration_options.get('batch_size', 100)
+        results = []
+        create = self.model_method('target', model, 'create')
+        
+        for batch in chunked(vals_list, batch_size):
+            try:
+                results.extend(create([batch]))
+                continue
+            except Exception as e:
+                if len(batch) == 1:
+                    results.append(e)
+                    continue
+                self.logger.warning("Batch create of %s %s records failed, retrying one by one: %s", len(batch), model, e)
+            
+            for vals in batch:
+                try:
+                    results.append(create([vals]))
+                except Exception as e:
+                    results.append(e)
+        
+        return results
+    
+    def write_records(self, model: str, updates: Iterable[tuple]) -> Dict[int, Exception]:
+        """
+        Write values to target records, one write per distinct set of values.
+        
+        Odoo's write applies the same values to every ID it is given, so records
+        getting identical values share a single round-trip. When a write fails
+        its records are retried one at a time.
+        
+        Args:
+            model: Target model name
+            updates: (record ID, values) pairs; records with empty values are skipped
+            
+        Returns:
+            Dictionary mapping the ID of every record that could not be written to
+            the exception raised
+        """
+        groups = {}
+        for record_id, vals in updates:
+            if vals:
+                groups.setdefault(tuple(sorted(vals.items())), []).append(record_id)
+        
+        failed = {}
+        write = self.model_method('target', model, 'write')
+        
+        for key, ids in groups.items():
+            vals = dict(key)
+            for batch in chunked(ids, 1000):
+                try:
+                    write([batch, vals])
+                    continue
+                except Exception as e:
+                    if len(batch) == 1:
+                        failed[batch[0]] = e
+                        continue
+                    self.logger.warning("Writing %s %s records failed, retrying one by one: %s", len(batch), model, e)
+                
+                for record_id in batch:
+                    try:
+                        write([[record_id], vals])
+                    except Exception as e:
+                        failed[record_id] = e
+        
+        return failed
+    
+    def migrate_website_data(self, data: Dict[str, Any]):
+        """
+        Migrate all website data to the target instance.
+        
+        Asset batches are read from the source on a background thread while the
+        other data is migrated, with up to ``prefetch_batches`` batches (default 2)
+        buffered ahead of the uploads.
+        """
+        if 'assets' in data:
+            assets = prefetch(data['assets'], self.migration_options.get('prefetch_batches', 2))
+        
         if 'websites' in data:
             self.migrate_websites(data['websites'])
         
@@ -353,79 +1103,95 @@ class EnhancedOdooWebsiteMigrator:
             self.migrate_website_themes(data['themes'])
         
         if 'assets' in data:
-            self.migrate_website_assets(data['assets'])
+            self.migrate_website_assets(assets)
     
     def migrate_websites(self, websites: List[Dict[str, Any]]):
         """Migrate websites to the target instance."""
         self.logger.info("Starting websites migration...")
         
+        skip_existing = self.migration_options.get('skip_existing', True)
+        existing_names = set()
+        
+        # Look up all websites that already exist in one go
+        if skip_existing:
+            try:
+                existing_names = self.get_existing_values('website', 'name', [w['name'] for w in websites])
+            except Exception as e:
+                error_msg = f"Error checking existing websites: {str(e)}"
+                self.logger.error(error_msg)
+                self.record_error(error_msg, 'websites')
+                return
+        
+        # (website, website_data) for every website that needs to be created
+        prepared = []
+        
         for website in websites:
             try:
                 # Check if website already exists
-                if self.migration_options.get('skip_existing', True):
-                    existing_website = self.target_models.execute_kw(
-                        self.target_db, self.target_uid, self.target_password,
-                        'website', 'search_read',
-                        [[('name', '=', website['name'])]],
-                        {'fields': ['id']}
-                    )
-                    
-                    if existing_website:
-                        self.logger.info(f"Website {website['name']} already exists, skipping...")
+                if skip_existing:
+                    if website['name'] in existing_names:
+                        self.logger.info("Website %s already exists, skipping...", website['name'])
                         continue
+                    existing_names.add(website['name'])
                 
                 # Prepare website data for migration
                 website_data = {
                     'name': website['name'],
                     'domain': website.get('domain', ''),
-                    'social_twitter': website.get('social_twitter', ''),
-                    'social_facebook': website.get('social_facebook', ''),
-                    'social_github': website.get('social_github', ''),
-                    'social_linkedin': website.get('social_linkedin', ''),
-                    'social_youtube': website.get('social_youtube', ''),
-                    'social_instagram': website.get('social_instagram', ''),
                     'google_analytics_key': website.get('google_analytics_key', ''),
                     'google_maps_api_key': website.get('google_maps_api_key', ''),
                     'cdn_activated': website.get('cdn_activated', False),
                     'cdn_url': website.get('cdn_url', ''),
                     'cdn_filters': website.get('cdn_filters', ''),
                 }
-                
-                # Create website in target
-                new_website_id = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'website', 'create',
-                    [website_data]
-                )
-                
-                self.logger.info(f"Successfully migrated website: {website['name']} (ID: {new_website_id})")
-                self.migration_stats['websites_migrated'] += 1
-                
-                # Also migrate website settings and configurations
-                self.migrate_website_settings(website, new_website_id)
+                if self.migration_options.get('migrate_social', True):
+                    website_data.update({field: website.get(field, '') for field in _SOCIAL_FIELDS})
+                if self.migration_options.get('migrate_branding', False):
+                    website_data.update({field: website[field] for field in _BRANDING_FIELDS if website.get(field)})
+                prepared.append((website, website_data))
                 
             except Exception as e:
                 error_msg = f"Error migrating website {website.get('name', 'Unknown')}: {str(e)}"
                 self.logger.error(error_msg)
-                self.migration_stats['errors'].append(error_msg)
+                self.record_error(error_msg, 'websites')
+        
+        # Create websites in target
+        new_website_ids = self.create_records('website', [website_data for _, website_data in prepared])
+        
+        migrated = []
+        for (website, _), new_website_id in zip(prepared, new_website_ids):
+            if isinstance(new_website_id, Exception):
+                error_msg = f"Error migrating website {website.get('name', 'Unknown')}: {str(new_website_id)}"
+                self.logger.error(error_msg)
+                self.record_error(error_msg, 'websites')
+                continue
+            
+            self.logger.info("Successfully migrated website: %s (ID: %s)", website['name'], new_website_id)
+            self.migration_stats['websites_migrated'] += 1
+            migrated.append((website, new_website_id))
+        
+        # Also migrate website settings and configurations; the writes of different
+        # websites are independent, so they are spread over a pool of threads
+        with ThreadPoolExecutor(max_workers=self.migration_options.get('max_workers', 8)) as executor:
+            list(executor.map(
+                self.migrate_website_settings,
+                [website for website, _ in migrated],
+                [new_website_id for _, new_website_id in migrated],
+            ))
     
     def migrate_website_settings(self, website: Dict[str, Any], new_website_id: int):
         """Migrate website settings and configurations."""
         try:
-            self.logger.info(f"Migrating settings for website: {website['name']}")
+            self.logger.info("Migrating settings for website: %s", website['name'])
             
             # Migrate website theme settings
             if website.get('theme_id'):
                 try:
                     # Try to set the theme for the new website
-                    self.target_models.execute_kw(
-                        self.target_db, self.target_uid, self.target_password,
-                        'website', 'write',
-                        [[new_website_id], {'theme_id': website['theme_id'][0]}]
-                    )
-                    self.logger.info(f"Applied theme to website: {website['name']}")
+                    self.model_method('target', 'website', 'write')([[new_website_id], {'theme_id': website['theme_id'][0]}])
+                    self.logger.info("Applied theme to website: %s", website['name'])
                 except Exception as e:
-                    self.logger.warning(f"Could not apply theme to website {website['name']}: {str(e)}")
+                    self.logger.warning("Could not apply theme to website %s: %s", website['name'], e)
             
             # Migrate website configuration settings
             config_data = {
@@ -437,37 +1203,49 @@ class EnhancedOdooWebsiteMigrator:
             }
             
             # Update website with additional settings
-            self.target_models.execute_kw(
-                self.target_db, self.target_uid, self.target_password,
-                'website', 'write',
-                [[new_website_id], config_data]
-            )
+            self.model_method('target', 'website', 'write')([[new_website_id], config_data])
             
-            self.logger.info(f"Successfully migrated settings for website: {website['name']}")
+            self.logger.info("Successfully migrated settings for website: %s", website['name'])
             
         except Exception as e:
             error_msg = f"Error migrating settings for website {website.get('name', 'Unknown')}: {str(e)}"
             self.logger.error(error_msg)
-            self.migration_stats['errors'].append(error_msg)
+            self.record_error(error_msg, 'website settings')
     
     def migrate_website_pages(self, pages: List[Dict[str, Any]]):
-        """Migrate website pages to the target instance."""
+        """
+        Migrate website pages to the target instance.
+        
+        Pages are prepared first and then created in batches: one pass creates the
+        views that builder pages point to, a second one creates the pages. The
+        per-page view and content updates run in a pool of ``max_workers`` threads.
+        """
         self.logger.info("Starting website pages migration...")
         
+        skip_existing = self.migration_options.get('skip_existing', True)
+        existing_urls = set()
+        
+        # Look up all pages that already exist in one go
+        if skip_existing:
+            try:
+                existing_urls = self.get_existing_values('website.page', 'url', [p['url'] for p in pages])
+            except Exception as e:
+                error_msg = f"Error checking existing pages: {str(e)}"
+                self.logger.error(error_msg)
+                self.record_error(error_msg, 'pages')
+                return
+        
+        # (page, view_data, page_data) for every page that needs to be created
+        prepared = []
+        
         for page in pages:
             try:
                 # Check if page already exists in target
-                if self.migration_options.get('skip_existing', True):
-                    existing_page = self.target_models.execute_kw(
-                        self.target_db, self.target_uid, self.target_password,
-                        'website.page', 'search_read',
-                        [[('url', '=', page['url'])]],
-                        {'fields': ['id']}
-                    )
-                    
-                    if existing_page:
-                        self.logger.info(f"Page {page['name']} already exists, skipping...")
+                if skip_existing:
+                    if page['url'] in existing_urls:
+                        self.logger.debug("Page %s already exists, skipping...", page['name'])
                         continue
+                    existing_urls.add(page['url'])
                 
                 # Prepare page data for migration
                 page_data = {
@@ -475,28 +1253,12 @@ class EnhancedOdooWebsiteMigrator:
                     'url': page['url'],
                     'is_published': page.get('is_published', True),
                 }
-                
-                # Handle content based on available fields
-                if 'arch_db' in page and page['arch_db']:
-                    page_data['arch_db'] = page['arch_db']
-                elif 'arch' in page and page['arch']:
-                    page_data['arch'] = page['arch']
-                else:
-                    # Create a minimal architecture if none exists
-                    safe_name = page["name"].replace(" ", "_").replace("-", "_").lower()
-                    page_data['arch'] = f'<t t-name="page_{safe_name}"><div class="container"><h1>{page["name"]}</h1><p>Content for {page["name"]}</p></div></t>'
-                
-                # Remove any problematic fields that might cause issues
-                if 'view_id' in page_data and not page_data['view_id']:
-                    del page_data['view_id']
-                
-
+                view_data = None
                 
                 # Handle builder pages differently
                 if page.get('is_builder_page', False):
                     # For builder pages, create the view first, then the page
                     if page.get('arch_db') or page.get('arch'):
-                        # Create the view in target
                         view_data = {
                             'name': page['name'],
                             'type': 'qweb',
@@ -504,35 +1266,7 @@ class EnhancedOdooWebsiteMigrator:
                             'arch': page.get('arch', ''),
                             'arch_db': page.get('arch_db', '')
                         }
-                        
-                        new_view_id = self.target_models.execute_kw(
-                            self.target_db, self.target_uid, self.target_password,
-                            'ir.ui.view', 'create',
-                            [view_data]
-                        )
-                        
-                        # Create page with view reference
-                        page_data = {
-                            'name': page['name'],
-                            'url': page['url'],
-                            'is_published': page.get('is_published', True),
-                            'view_id': new_view_id
-                        }
-                    else:
-                        # Create basic page without view
-                        page_data = {
-                            'name': page['name'],
-                            'url': page['url'],
-                            'is_published': page.get('is_published', True),
-                        }
                 else:
-                    # For regular pages, use the existing logic
-                    page_data = {
-                        'name': page['name'],
-                        'url': page['url'],
-                        'is_published': page.get('is_published', True),
-                    }
-                    
                     # Add architecture if available
                     if 'arch_db' in page and page['arch_db']:
                         page_data['arch_db'] = page['arch_db']
@@ -543,45 +1277,115 @@ class EnhancedOdooWebsiteMigrator:
                         safe_name = page["name"].replace(" ", "_").replace("-", "_").lower()
                         page_data['arch'] = f'<t t-name="page_{safe_name}"><div class="container"><h1>{page["name"]}</h1><p>Content for {page["name"]}</p></div></t>'
                 
-                new_page_id = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'website.page', 'create',
-                    [page_data]
-                )
-                
-                self.logger.info(f"Successfully migrated page: {page['name']} (ID: {new_page_id})")
-                self.migration_stats['pages_migrated'] += 1
-                
-                # Try to migrate the associated view if it exists
-                if page.get('view_id'):
-                    self.migrate_page_view(page['view_id'], new_page_id)
-                
-                # Try to migrate additional page content (only for non-builder pages)
-                if not page.get('is_builder_page', False):
-                    self.migrate_page_content(page['id'], new_page_id)
-                
-                # Try to migrate builder content
-                self.migrate_page_builder_content(page['name'], new_page_id)
+                prepared.append((page, view_data, page_data))
                 
             except Exception as e:
                 error_msg = f"Error migrating page {page.get('name', 'Unknown')}: {str(e)}"
                 self.logger.error(error_msg)
-                self.migration_stats['errors'].append(error_msg)
+                self.record_error(error_msg, 'pages')
+        
+        # Create the views of builder pages, then link them from the page data
+        with_view = [item for item in prepared if item[1] is not None]
+        new_view_ids = self.create_records('ir.ui.view', [view_data for _, view_data, _ in with_view])
+        failed_pages = set()
+        
+        for (page, _, page_data), new_view_id in zip(with_view, new_view_ids):
+            if isinstance(new_view_id, Exception):
+                error_msg = f"Error migrating page {page.get('name', 'Unknown')}: {str(new_view_id)}"
+                self.logger.error(error_msg)
+                self.record_error(error_msg, 'pages')
+                failed_pages.add(id(page))
+            else:
+                page_data['view_id'] = new_view_id
+        
+        prepared = [item for item in prepared if id(item[0]) not in failed_pages]
+        
+        # Fetch the source content for all pages up front instead of once per page
+        page_contents = self.get_page_contents(
+            [page['id'] for page, _, _ in prepared if not page.get('is_builder_page', False)]
+        )
+        builder_views = self.get_builder_views([page['name'] for page, _, _ in prepared])
+        self.get_source_views([self.get_view_id(page) for page, _, _ in prepared if page.get('view_id')])
+        
+        # Pages that keep the view they are created with get their final content in
+        # the create payload; the others get it once their own view is migrated
+        for page, _, page_data in prepared:
+            if not page.get('view_id'):
+                page_data.update(self.get_page_update(
+                    page, page_contents.get(page.get('id')), builder_views.get(page['name'])
+                ))
+        
+        new_page_ids = self.create_records('website.page', [page_data for _, _, page_data in prepared])
+        
+        migrated = []
+        for (page, _, _), new_page_id in zip(prepared, new_page_ids):
+            if isinstance(new_page_id, Exception):
+                error_msg = f"Error migrating page {page.get('name', 'Unknown')}: {str(new_page_id)}"
+                self.logger.error(error_msg)
+                self.record_error(error_msg, 'pages')
+                continue
+            
+            self.logger.debug("Successfully migrated page: %s (ID: %s)", page['name'], new_page_id)
+            self.migration_stats['pages_migrated'] += 1
+            migrated.append((page, new_page_id))
+        
+        self.logger.info("Migrated %s of %s pages", len(migrated), len(pages))
+        
+        # The view migrations of different pages are independent of each other,
+        # so they are spread over a pool of threads
+        with_source_view = [(page, new_page_id) for page, new_page_id in migrated if page.get('view_id')]
+        with ThreadPoolExecutor(max_workers=self.migration_options.get('max_workers', 8)) as executor:
+            list(executor.map(
+                self.migrate_page_view,
+                [self.get_view_id(page) for page, _ in with_source_view],
+                [new_page_id for _, new_page_id in with_source_view],
+            ))
+        
+        # Then copy the content of those pages, with one write for all pages sharing the same values
+        failed = self.write_records('website.page', [
+            (new_page_id, self.get_page_update(page, page_contents.get(page.get('id')), builder_views.get(page['name'])))
+            for page, new_page_id in with_source_view
+        ])
+        page_names = {new_page_id: page['name'] for page, new_page_id in with_source_view}
+        for new_page_id, e in failed.items():
+            self.logger.warning("Could not migrate content for page %s: %s", page_names[new_page_id], e)
+    
+    def get_view_id(self, page: Dict[str, Any]) -> int:
+        """Return the source view ID of a page, whether it was read as a many2one or a plain ID."""
+        view_id = page['view_id']
+        return view_id[0] if isinstance(view_id, (list, tuple)) else view_id
+    
+    def get_source_views(self, view_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Read source views in bulk, skipping the ones that were already read.
+        
+        Args:
+            view_ids: IDs of the source ir.ui.view records
+            
+        Returns:
+            Dictionary mapping view ID to its values
+        """
+        missing = [view_id for view_id in dict.fromkeys(view_ids) if view_id not in self._view_cache]
+        try:
+            for batch in chunked(missing, 1000):
+                records = self.source_models.execute_kw(
+                    self.source_db, self.source_uid, self.source_password,
+                    'ir.ui.view', 'read',
+                    [batch],
+                    {'fields': ['name', 'type', 'arch', 'key']}
+                )
+                self._view_cache.update((record['id'], record) for record in records)
+        except Exception as e:
+            self.logger.warning("Could not read source views: %s", e)
+        return {view_id: self._view_cache[view_id] for view_id in view_ids if view_id in self._view_cache}
     
     def migrate_page_view(self, view_id: int, new_page_id: int):
         """Migrate the view associated with a page."""
         try:
             # Get the view from source
-            view = self.source_models.execute_kw(
-                self.source_db, self.source_uid, self.source_password,
-                'ir.ui.view', 'read',
-                [view_id],
-                {'fields': ['name', 'type', 'arch', 'arch_fs', 'key', 'inherit_id']}
-            )
+            view_data = self.get_source_views([view_id]).get(view_id)
             
-            if view:
-                view_data = view[0]
-                
+            if view_data:
                 # Create the view in target
                 new_view_data = {
                     'name': view_data['name'],
@@ -591,233 +1395,447 @@ class EnhancedOdooWebsiteMigrator:
                 }
                 
                 # Create view in target
-                new_view_id = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'ir.ui.view', 'create',
-                    [new_view_data]
-                )
+                new_view_id = self.model_method('target', 'ir.ui.view', 'create')([new_view_data])
                 
                 # Update the page to reference the new view
-                self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'website.page', 'write',
-                    [[new_page_id], {'view_id': new_view_id}]
-                )
+                self.model_method('target', 'website.page', 'write')([[new_page_id], {'view_id': new_view_id}])
                 
-                self.logger.info(f"Successfully migrated view for page (View ID: {new_view_id})")
+                self.logger.debug("Successfully migrated view for page (View ID: %s)", new_view_id)
                 
         except Exception as e:
-            self.logger.warning(f"Could not migrate view for page: {str(e)}")
+            self.logger.warning("Could not migrate view for page: %s", e)
     
-    def migrate_page_content(self, page_id: int, new_page_id: int):
-        """Migrate the content of a page from website builder."""
-        try:
-            # Get page content from source
-            page_content = self.source_models.execute_kw(
-                self.source_db, self.source_uid, self.source_password,
-                'website.page', 'read',
-                [page_id],
-                {'fields': ['arch_db', 'arch']}
-            )
+    def get_page_contents(self, page_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Read the architecture of the given source pages in bulk.
+        
+        Args:
+            page_ids: IDs of the source website.page records
             
-            if page_content:
-                content_data = page_content[0]
-                update_data = {}
-                
-                # Update architecture if available
-                if content_data.get('arch_db'):
-                    update_data['arch_db'] = content_data['arch_db']
-                elif content_data.get('arch'):
-                    update_data['arch'] = content_data['arch']
-                
-                # Update the page in target
-                if update_data:
-                    self.target_models.execute_kw(
-                        self.target_db, self.target_uid, self.target_password,
-                        'website.page', 'write',
-                        [[new_page_id], update_data]
-                    )
-                    
-                    self.logger.info(f"Successfully migrated content for page (ID: {new_page_id})")
-                
+        Returns:
+            Dictionary mapping page ID to its arch_db/arch values
+        """
+        contents = {}
+        try:
+            for batch in chunked(page_ids, 1000):
+                records = self.source_models.execute_kw(
+                    self.source_db, self.source_uid, self.source_password,
+                    'website.page', 'read',
+                    [batch],
+                    {'fields': ['arch_db', 'arch']}
+                )
+                contents.update((record['id'], record) for record in records)
         except Exception as e:
-            self.logger.warning(f"Could not migrate content for page: {str(e)}")
+            self.logger.warning("Could not read content for pages: %s", e)
+        return contents
     
-    def migrate_page_builder_content(self, page_name: str, new_page_id: int):
-        """Migrate the content of a page from website builder views."""
-        try:
-            # Get page content from website builder views
-            builder_views = self.source_models.execute_kw(
-                self.source_db, self.source_uid, self.source_password,
-                'ir.ui.view', 'search_read',
-                [[('type', '=', 'qweb'), ('name', '=', page_name)]],
-                {'fields': ['arch_db', 'arch']}
-            )
+    def get_builder_views(self, page_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up the website builder views of the given pages in bulk.
+        
+        Views already fetched by get_website_pages are reused; only the
+        remaining names are queried from the source.
+        
+        Args:
+            page_names: Names of the source pages
             
-            if builder_views:
-                view_data = builder_views[0]
-                update_data = {}
-                
-                # Update architecture if available
-                if view_data.get('arch_db'):
-                    update_data['arch_db'] = view_data['arch_db']
-                elif view_data.get('arch'):
-                    update_data['arch'] = view_data['arch']
-                
-                if update_data:
-                    self.target_models.execute_kw(
-                        self.target_db, self.target_uid, self.target_password,
-                        'website.page', 'write',
-                        [[new_page_id], update_data]
-                    )
-                    self.logger.info(f"Updated page {page_name} with builder content")
-                    
+        Returns:
+            Dictionary mapping page name to the first matching qweb view
+        """
+        views = {name: self._view_index[name] for name in page_names if name in self._view_index}
+        missing = [name for name in dict.fromkeys(page_names) if name not in views]
+        try:
+            for batch in chunked(missing, 1000):
+                records = self.source_models.execute_kw(
+                    self.source_db, self.source_uid, self.source_password,
+                    'ir.ui.view', 'search_read',
+                    [[('type', '=', 'qweb'), ('name', 'in', batch)]],
+                    {'fields': ['name', 'arch_db', 'arch']}
+                )
+                for record in records:
+                    views.setdefault(record['name'], record)
         except Exception as e:
-            self.logger.warning(f"Could not migrate builder content for page {page_name}: {str(e)}")
+            self.logger.warning("Could not read builder views for pages: %s", e)
+        return views
+    
+    def get_page_update(self, page: Dict[str, Any], page_content: Optional[Dict[str, Any]],
+                        builder_view: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the content values to write on a page that was just created in the target.
+        
+        Builder content is applied over the regular content of the page, the same
+        way a second write would override the first.
+        """
+        update_data = {}
+        
+        # Regular content only applies to non-builder pages
+        if not page.get('is_builder_page', False):
+            update_data.update(self.get_arch_values(page_content))
+        update_data.update(self.get_arch_values(builder_view))
+        
+        return update_data
+    
+    def get_arch_values(self, record: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the architecture of a source page or view, preferring arch_db over arch."""
+        update_data = {}
+        if record:
+            if record.get('arch_db'):
+                update_data['arch_db'] = record['arch_db']
+            elif record.get('arch'):
+                update_data['arch'] = record['arch']
+        return update_data
     
     def migrate_website_menus(self, menus: List[Dict[str, Any]]):
-        """Migrate website menus to the target instance."""
+        """
+        Migrate website menus to the target instance.
+        
+        Menus are created one tree level at a time, so parents always exist before
+        their children. A menu skipped because it already exists still counts as
+        the parent of its source children, which are attached to the existing
+        target menu.
+        """
         self.logger.info("Starting website menus migration...")
         
-        # Create a mapping of old menu IDs to new menu IDs
-        menu_id_mapping = {}
+        skip_existing = self.migration_options.get('skip_existing', True)
+        existing_menus = {}
         
-        for menu in menus:
+        # Look up all menus that already exist in one go, mapping (name, url) to
+        # the target menu ID
+        if skip_existing:
             try:
-                # Check if menu already exists
-                if self.migration_options.get('skip_existing', True):
-                    existing_menu = self.target_models.execute_kw(
-                        self.target_db, self.target_uid, self.target_password,
-                        'website.menu', 'search_read',
-                        [[('name', '=', menu['name']), ('url', '=', menu.get('url', ''))]],
-                        {'fields': ['id']}
+                existing_menus = {
+                    (record['name'], record['url'] or ''): record['id']
+                    for record in self.get_existing_records(
+                        'website.menu', 'name', [m['name'] for m in menus], ['name', 'url']
                     )
-                    
-                    if existing_menu:
-                        self.logger.info(f"Menu {menu['name']} already exists, skipping...")
-                        continue
-                
-                # Prepare menu data
-                menu_data = {
-                    'name': menu['name'],
-                    'url': menu.get('url', ''),
-                    'sequence': menu.get('sequence', 10),
-                    'is_visible': menu.get('is_visible', True),
-                    'is_mega_menu': menu.get('is_mega_menu', False),
                 }
-                
-                # Handle parent menu mapping
-                if menu.get('parent_id') and menu['parent_id'][0] in menu_id_mapping:
-                    menu_data['parent_id'] = menu_id_mapping[menu['parent_id'][0]]
-                
-                # Create menu in target
-                new_menu_id = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'website.menu', 'create',
-                    [menu_data]
-                )
+            except Exception as e:
+                error_msg = f"Error checking existing menus: {str(e)}"
+                self.logger.error(error_msg)
+                self.record_error(error_msg, 'menus')
+                return
+        
+        # Create a mapping of old menu IDs to new menu IDs
+        menu_id_mapping = {}
+        
+        # Create the menus one tree level at a time, so every parent exists
+        # before the batch holding its children is sent
+        for depth, level in enumerate(self.group_menus_by_level(menus)):
+            # (menu, menu_data) for every menu of this level that needs to be created
+            prepared = []
+            
+            for menu in level:
+                try:
+                    # Check if menu already exists
+                    if skip_existing:
+                        menu_key = (menu['name'], menu.get('url') or '')
+                        if menu_key in existing_menus:
+                            self.logger.debug("Menu %s already exists, skipping...", menu['name'])
+                            if existing_menus[menu_key]:
+                                menu_id_mapping[menu['id']] = existing_menus[menu_key]
+                            continue
+                        # Claimed by this menu; the ID is filled in once it is created
+                        existing_menus[menu_key] = None
+                    
+                    # Prepare menu data
+                    menu_data = {
+                        'name': menu['name'],
+                        'url': menu.get('url', ''),
+                        'sequence': menu.get('sequence', 10),
+                        'is_visible': menu.get('is_visible', True),
+                        'is_mega_menu': menu.get('is_mega_menu', False),
+                    }
+                    
+                    # Handle parent menu mapping
+                    if menu.get('parent_id') and menu['parent_id'][0] in menu_id_mapping:
+                        menu_data['parent_id'] = menu_id_mapping[menu['parent_id'][0]]
+                    
+                    prepared.append((menu, menu_data))
+                    
+                except Exception as e:
+                    error_msg = f"Error migrating menu {menu.get('name', 'Unknown')}: {str(e)}"
+                    self.logger.error(error_msg)
+                    self.record_error(error_msg, 'menus')
+            
+            new_menu_ids = self.create_records('website.menu', [menu_data for _, menu_data in prepared])
+            
+            migrated = 0
+            for (menu, _), new_menu_id in zip(prepared, new_menu_ids):
+                if isinstance(new_menu_id, Exception):
+                    error_msg = f"Error migrating menu {menu.get('name', 'Unknown')}: {str(new_menu_id)}"
+                    self.logger.error(error_msg)
+                    self.record_error(error_msg, 'menus')
+                    continue
                 
                 # Store mapping for child menus
                 menu_id_mapping[menu['id']] = new_menu_id
+                if skip_existing:
+                    existing_menus[(menu['name'], menu.get('url') or '')] = new_menu_id
                 
-                self.logger.info(f"Successfully migrated menu: {menu['name']} (ID: {new_menu_id})")
+                self.logger.debug("Successfully migrated menu: %s (ID: %s)", menu['name'], new_menu_id)
                 self.migration_stats['menus_migrated'] += 1
-                
-            except Exception as e:
-                error_msg = f"Error migrating menu {menu.get('name', 'Unknown')}: {str(e)}"
-                self.logger.error(error_msg)
-                self.migration_stats['errors'].append(error_msg)
+                migrated += 1
+            
+            self.logger.info("Migrated %s of %s menus at depth %s", migrated, len(level), depth)
+    
+    def group_menus_by_level(self, menus: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Group menus by their depth in the menu tree, roots first.
+        
+        Menus whose parent is not part of ``menus`` count as roots. Menus that
+        can't be reached from a root because their parents form a cycle are put
+        in a last group of their own.
+        
+        Args:
+            menus: Source menus
+            
+        Returns:
+            Lists of menus, one per tree level
+        """
+        menu_ids = {menu['id'] for menu in menus}
+        children = {}
+        level = []
+        
+        for menu in menus:
+            parent_id = menu['parent_id'][0] if menu.get('parent_id') else None
+            if parent_id in menu_ids:
+                children.setdefault(parent_id, []).append(menu)
+            else:
+                level.append(menu)
+        
+        levels = []
+        while level:
+            levels.append(level)
+            level = [child for menu in level for child in children.pop(menu['id'], [])]
+        
+        unreachable = [menu for group in children.values() for menu in group]
+        if unreachable:
+            levels.append(unreachable)
+        
+        return levels
     
     def migrate_website_themes(self, themes: List[Dict[str, Any]]):
         """Migrate website themes to the target instance."""
         self.logger.info("Starting website themes migration...")
         
+        # Look up the target modules of all themes in one go
+        try:
+            target_modules = self.get_target_modules([t['name'] for t in themes])
+        except Exception as e:
+            error_msg = f"Error checking existing themes: {str(e)}"
+            self.logger.error(error_msg)
+            self.record_error(error_msg, 'themes')
+            return
+        
+        # (theme, module_id) for every theme that needs to be installed
+        to_install = []
+        
         for theme in themes:
-            try:
-                # Check if theme is already installed in target
-                if self.migration_options.get('skip_existing', True):
-                    existing_theme = self.target_models.execute_kw(
-                        self.target_db, self.target_uid, self.target_password,
-                        'ir.module.module', 'search_read',
-                        [[('name', '=', theme['name'])]],
-                        {'fields': ['state']}
-                    )
-                    
-                    if existing_theme and existing_theme[0]['state'] == 'installed':
-                        self.logger.info(f"Theme {theme['name']} already installed, skipping...")
-                        continue
-                
-                # Try to install the theme - use search to get the module ID first
-                module_ids = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'ir.module.module', 'search',
-                    [[('name', '=', theme['name'])]]
-                )
-                
-                if module_ids:
-                    # Try to install the theme
-                    self.target_models.execute_kw(
-                        self.target_db, self.target_uid, self.target_password,
-                        'ir.module.module', 'button_immediate_install',
-                        [module_ids]
-                    )
-                else:
-                    self.logger.warning(f"Theme {theme['name']} not found in target instance")
+            target_module = target_modules.get(theme['name'])
+            
+            # Check if theme is already installed in target
+            if self.migration_options.get('skip_existing', True):
+                if target_module and target_module['state'] == 'installed':
+                    self.logger.info("Theme %s already installed, skipping...", theme['name'])
                     continue
-                
-                self.logger.info(f"Successfully installed theme: {theme['name']}")
-                self.migration_stats['themes_migrated'] += 1
-                
-            except Exception as e:
+            
+            if not target_module:
+                self.logger.warning("Theme %s not found in target instance", theme['name'])
+                continue
+            
+            to_install.append((theme, target_module['id']))
+        
+        if not to_install:
+            return
+        
+        # Install all themes with one call, so the server goes through a single
+        # upgrade and registry reload; fall back to one call per theme if it fails
+        try:
+            self.model_method('target', 'ir.module.module', 'button_immediate_install')(
+                [[module_id for _, module_id in to_install]]
+            )
+            installed = [theme for theme, _ in to_install]
+        except Exception as e:
+            if len(to_install) == 1:
+                theme = to_install[0][0]
                 error_msg = f"Error installing theme {theme.get('name', 'Unknown')}: {str(e)}"
                 self.logger.error(error_msg)
-                self.migration_stats['errors'].append(error_msg)
+                self.record_error(error_msg, 'themes')
+                return
+            
+            self.logger.warning("Installing %s themes at once failed, retrying one by one: %s", len(to_install), e)
+            installed = []
+            for theme, module_id in to_install:
+                try:
+                    self.model_method('target', 'ir.module.module', 'button_immediate_install')([[module_id]])
+                    installed.append(theme)
+                except Exception as e:
+                    error_msg = f"Error installing theme {theme.get('name', 'Unknown')}: {str(e)}"
+                    self.logger.error(error_msg)
+                    self.record_error(error_msg, 'themes')
+        
+        for theme in installed:
+            self.logger.info("Successfully installed theme: %s", theme['name'])
+            self.migration_stats['themes_migrated'] += 1
+            self._module_cache[theme['name']]['state'] = 'installed'
     
-    def migrate_website_assets(self, assets: List[Dict[str, Any]]):
-        """Migrate website assets to the target instance."""
+    def get_target_modules(self, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up target modules by technical name, skipping the ones already looked up.
+        
+        Args:
+            names: Technical module names
+            
+        Returns:
+            Dictionary mapping the name of every module found to its ID and state
+        """
+        missing = [name for name in names if name not in self._module_cache]
+        if missing:
+            found = {
+                record['name']: record
+                for record in self.get_existing_records('ir.module.module', 'name', missing, ['name', 'state'])
+            }
+            # Modules that don't exist are cached as well, so they aren't searched again
+            self._module_cache.update((name, found.get(name)) for name in missing)
+        return {name: self._module_cache[name] for name in names if self._module_cache[name]}
+    
+    def migrate_website_assets(self, assets: Iterable[List[Dict[str, Any]]]):
+        """
+        Migrate website assets to the target instance.
+        
+        For every batch, existing assets are filtered out with one lookup, so
+        nothing is downloaded for assets that are skipped. The remaining ones are
+        split into upload groups of at most ``batch_size`` assets and
+        ``max_upload_bytes`` bytes (default 8 MB, based on the source file sizes).
+        Each group's payloads are read from the source and sent to the target in
+        one create call on a pool of ``max_workers`` threads (default 8), so only
+        the groups being uploaded are held in memory.
+        
+        Args:
+            assets: Batches of source attachments, as yielded by iter_website_assets
+        """
         self.logger.info("Starting website assets migration...")
         
-        for asset in assets:
-            try:
-                # Check if asset already exists
-                if self.migration_options.get('skip_existing', True):
-                    existing_asset = self.target_models.execute_kw(
-                        self.target_db, self.target_uid, self.target_password,
-                        'ir.attachment', 'search_read',
-                        [[('name', '=', asset['name'])]],
-                        {'fields': ['id']}
-                    )
+        skip_existing = self.migration_options.get('skip_existing', True)
+        seen_names = set()
+        max_workers = self.migration_options.get('max_workers', 8)
+        batch_size = self.migration_options.get('batch_size', 100)
+        max_upload_bytes = self.migration_options.get('max_upload_bytes', 8 * 1024 * 1024)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch in assets:
+                try:
+                    # Check which assets already exist
+                    if skip_existing:
+                        names = [asset['name'] for asset in batch if asset['name'] not in seen_names]
+                        seen_names.update(self.get_existing_values('ir.attachment', 'name', names))
+                        
+                        to_migrate = []
+                        for asset in batch:
+                            if asset['name'] in seen_names:
+                                self.logger.debug("Asset %s already exists, skipping...", asset['name'])
+                                continue
+                            seen_names.add(asset['name'])
+                            to_migrate.append(asset)
+                    else:
+                        to_migrate = batch
                     
-                    if existing_asset:
-                        self.logger.info(f"Asset {asset['name']} already exists, skipping...")
-                        continue
-                
-                # Prepare asset data
-                asset_data = {
-                    'name': asset['name'],
-                    'mimetype': asset['mimetype'],
-                    'datas': asset.get('datas', ''),
-                    'url': asset.get('url', ''),
-                }
-                
-                # Create asset in target
-                new_asset_id = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'ir.attachment', 'create',
-                    [asset_data]
-                )
-                
-                self.logger.info(f"Successfully migrated asset: {asset['name']} (ID: {new_asset_id})")
-                self.migration_stats['assets_migrated'] += 1
+                except Exception as e:
+                    for asset in batch:
+                        error_msg = f"Error migrating asset {asset.get('name', 'Unknown')}: {str(e)}"
+                        self.logger.error(error_msg)
+                        self.record_error(error_msg, 'assets')
+                    continue
                 
-            except Exception as e:
+                groups = self.group_assets_by_size(to_migrate, batch_size, max_upload_bytes)
+                list(executor.map(self.migrate_website_asset_batch, groups))
+    
+    def group_assets_by_size(self, assets: List[Dict[str, Any]], max_count: int,
+                             max_bytes: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Split assets into upload groups bounded by count and payload size.
+        
+        An asset larger than ``max_bytes`` gets a group of its own.
+        
+        Args:
+            assets: Source attachments, with their ``file_size``
+            max_count: Maximum number of assets per group
+            max_bytes: Maximum total file size per group
+            
+        Yields:
+            Lists of assets
+        """
+        group = []
+        group_bytes = 0
+        
+        for asset in assets:
+            size = asset.get('file_size') or 0
+            if group and (len(group) >= max_count or group_bytes + size > max_bytes):
+                yield group
+                group = []
+                group_bytes = 0
+            group.append(asset)
+            group_bytes += size
+        
+        if group:
+            yield group
+    
+    def migrate_website_asset_batch(self, assets: List[Dict[str, Any]]):
+        """Read the payloads of a group of website assets and create them in the target in one call."""
+        try:
+            # Assets whose payload could not be read were already reported
+            self.read_asset_datas(assets)
+            assets = [asset for asset in assets if 'datas' in asset]
+        except Exception as e:
+            for asset in assets:
                 error_msg = f"Error migrating asset {asset.get('name', 'Unknown')}: {str(e)}"
                 self.logger.error(error_msg)
-                self.migration_stats['errors'].append(error_msg)
+                self.record_error(error_msg, 'assets')
+            return
+        
+        # Prepare asset data; Odoo hands binary fields out as base64 text, which
+        # is forwarded verbatim and moved out of the source records
+        asset_data = [
+            {
+                'name': asset['name'],
+                'mimetype': asset['mimetype'],
+                'datas': asset.pop('datas', ''),
+                'url': asset.get('url', ''),
+            }
+            for asset in assets
+        ]
+        
+        # Create assets in target
+        new_asset_ids = self.create_records('ir.attachment', asset_data)
+        
+        # The payloads are no longer needed once the call has returned
+        del asset_data
+        
+        migrated = 0
+        for asset, new_asset_id in zip(assets, new_asset_ids):
+            if isinstance(new_asset_id, Exception):
+                error_msg = f"Error migrating asset {asset.get('name', 'Unknown')}: {str(new_asset_id)}"
+                self.logger.error(error_msg)
+                self.record_error(error_msg, 'assets')
+                continue
+            
+            self.logger.debug("Successfully migrated asset: %s (ID: %s)", asset['name'], new_asset_id)
+            migrated += 1
+        
+        with self._stats_lock:
+            self.migration_stats['assets_migrated'] += migrated
+            total = self.migration_stats['assets_migrated']
+        self.logger.info("Migrated %s assets, %s in total", migrated, total)
     
     def generate_migration_report(self):
-        """Generate a comprehensive migration report."""
-        report = f"""
+        """
+        Generate a comprehensive migration report.
+        
+        The report is written piece by piece to both the report file and the
+        console instead of being assembled into one string first, which keeps
+        long error lists cheap.
+        """
+        header = f"""
 Enhanced Odoo Website Migration Report
 =====================================
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -840,22 +1858,34 @@ Migration Options Used:
 - Migrate themes: {self.migration_options.get('migrate_themes', True)}
 - Migrate assets: {self.migration_options.get('migrate_assets', True)}
 
-Errors ({len(self.migration_stats['errors'])}):
+Errors ({self.migration_stats['errors_count']}):
 """
         
-        for error in self.migration_stats['errors']:
-            report += f"- {error}\n"
-        
-        if not self.migration_stats['errors']:
-            report += "- No errors encountered\n"
-        
-        # Save report to file
-        report_filename = f'enhanced_migration_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
+        # Save report to file and echo it to the console
+        report_filename = f'enhanced_migration_report_{self._run_ts}.txt'
         with open(report_filename, 'w') as f:
-            f.write(report)
+            def write(text):
+                f.write(text)
+                sys.stdout.write(text)
+            
+            write(header)
+            for category, count in self.migration_stats['errors_by_category'].most_common():
+                write(f"- {category}: {count}\n")
+            
+            omitted = self.migration_stats['errors_count'] - len(self.migration_stats['errors'])
+            if self.migration_stats['errors_count']:
+                write("\n")
+            if omitted:
+                write(f"- {omitted} earlier errors omitted, see the log file\n")
+            
+            for error in self.migration_stats['errors']:
+                write(f"- {error}\n")
+            
+            if not self.migration_stats['errors_count']:
+                write("- No errors encountered\n")
         
-        self.logger.info(f"Migration report saved to: {report_filename}")
-        print(report)
+        sys.stdout.write("\n")
+        self.logger.info("Migration report saved to: %s", report_filename)
     
     def run_migration(self):
         """Run the complete migration process."""
@@ -881,8 +1911,14 @@ Errors ({len(self.migration_stats['errors'])}):
             self.logger.info("Migration completed successfully!")
             
         except Exception as e:
-            self.logger.error(f"Migration failed: {str(e)}")
+            self.logger.error("Migration failed: %s", e)
             raise
+        finally:
+            # Let the listener drain the queue, then write out whatever is still
+            # buffered for the log file
+            self._log_listener.stop()
+            for handler in self._log_listener.handlers:
+                handler.flush()
 
 
 def main():
@@ -909,34 +1945,47 @@ def main():
     parser.add_argument('--no-menus', action='store_true', help='Skip menu migration')
     parser.add_argument('--no-themes', action='store_true', help='Skip theme migration')
     parser.add_argument('--no-assets', action='store_true', help='Skip asset migration')
+    parser.add_argument('--since', metavar='DATE', help='Only migrate assets created on or after this date (YYYY-MM-DD)')
     
-    args = parser.parse_args()
+    # Source data snapshots
+    parser.add_argument('--save-snapshot', action='store_true', help='Save fetched source data to a snapshot file')
+    parser.add_argument('--use-snapshot', metavar='PATH', help='Load source data from a snapshot file instead of the source')
     
-    # Prepare migration options
-    migration_options = {
-        'skip_existing': not args.no_skip_existing,
-        'migrate_pages': not args.no_pages,
-        'migrate_menus': not args.no_menus,
-        'migrate_themes': not args.no_themes,
-        'migrate_assets': not args.no_assets,
-    }
+    args = parser.parse_args()
     
-    # Get passwords if not provided
-    source_password = args.source_password or getpass.getpass('Source password: ')
-    target_password = args.target_password or getpass.getpass('Target password: ')
+    # Prepare migration options; only the flags given override the config file
+    migration_options = {}
+    if args.no_skip_existing:
+        migration_options['skip_existing'] = False
+    if args.no_pages:
+        migration_options['migrate_pages'] = False
+    if args.no_menus:
+        migration_options['migrate_menus'] = False
+    if args.no_themes:
+        migration_options['migrate_themes'] = False
+    if args.no_assets:
+        migration_options['migrate_assets'] = False
+    if args.since:
+        migration_options['since'] = args.since
+    if args.save_snapshot:
+        migration_options['save_snapshot'] = True
+    if args.use_snapshot:
+        migration_options['use_snapshot'] = args.use_snapshot
     
-    # Create and run migrator
+    # Create and run migrator; missing passwords are asked for when connecting
     migrator = EnhancedOdooWebsiteMigrator(
         config_file=args.config,
-        source_url=args.source_url,
-        source_db=args.source_db,
-        source_username=args.source_username,
-        source_password=source_password,
-        target_url=args.target_url,
-        target_db=args.target_db,
-        target_username=args.target_username,
-        target_password=target_password,
-        migration_options=migration_options
+        migration_options=migration_options,
+        **{
+            'source.url': args.source_url,
+            'source.database': args.source_db,
+            'source.username': args.source_username,
+            'source.password': args.source_password,
+            'target.url': args.target_url,
+            'target.database': args.target_db,
+            'target.username': args.target_username,
+            'target.password': args.target_password,
+        }
     )
     
     try:
@@ -14,22 +14,110 @@ Supports migration of:
 """
 
 import xmlrpc.client
+import gzip
+import http.client
+import http.cookiejar
 import json
 import logging
+import logging.handlers
+import queue
 import sys
 import os
+import itertools
+import functools
+import collections
+import hashlib
+import ssl
+import threading
+import time
+import urllib.request
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Callable, Optional, Iterable, Iterator
 import argparse
 import getpass
 
+try:
+    # SIMD implementation with the same interface, used for the asset payloads
+    # when it is installed
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+
+# SSL context that ignores certificate verification for HTTPS connections;
+# built once and shared by every transport, see create_transport
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+
+# XML-RPC request bodies larger than this are gzip-compressed when enabled,
+# see create_transport
+_GZIP_THRESHOLD = 1400
+
+# Module of the XML IDs given to migrated records on the target, see
+# save_migrated_ids
+_XMLID_MODULE = '__migrator__'
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most ``size`` items from ``items``."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def disk_memoize(func):
+    """
+    Cache the results of a source read method on disk.
+    
+    The result is stored as JSON under the migrator's ``cache_dir`` in a file
+    named after a hash of the source URL, database, user and call arguments, and
+    is returned from there by later runs until it is older than ``cache_ttl``
+    seconds. Nothing is cached when ``cache_dir`` is None (the default), and
+    failed reads are never cached.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not self.cache_dir:
+            return func(self, *args, **kwargs)
+        
+        key = repr((self.source_url, self.source_db, self.source_username,
+                    func.__name__, args, sorted(kwargs.items())))
+        path = os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + '.json')
+        
+        try:
+            if time.time() - os.path.getmtime(path) < self.cache_ttl:
+                with open(path, 'r') as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+        
+        result = func(self, *args, **kwargs)
+        
+        # Write to a temporary file first so an interrupted run never leaves a
+        # truncated entry behind
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+        return result
+    return wrapper
+
 
 class OdooWebsiteMigrator:
     """Main class for migrating website data between Odoo instances."""
     
     def __init__(self, source_url: str, source_db: str, source_username: str, 
                  source_password: str, target_url: str, target_db: str, 
-                 target_username: str, target_password: str):
+                 target_username: str, target_password: str, max_workers: int = 8,
+                 cache_dir: Optional[str] = None, cache_ttl: float = 86400,
+                 gzip_requests: bool = False):
         """
         Initialize the migrator with connection details for both Odoo instances.
         
@@ -42,6 +130,12 @@ class OdooWebsiteMigrator:
             target_db: Database name of the target instance
             target_username: Username for target instance
             target_password: Password for target instance
+            max_workers: Number of threads used for concurrent RPC calls
+            cache_dir: Directory where source reads are cached between runs, or
+                None (the default) to always read from the source
+            cache_ttl: Age in seconds after which a cached source read is refetched
+            gzip_requests: Whether to gzip-compress large XML-RPC requests; the
+                server, or a proxy in front of it, must decompress them
         """
         self.source_url = source_url.rstrip('/')
         self.source_db = source_db
@@ -53,40 +147,193 @@ class OdooWebsiteMigrator:
         self.target_username = target_username
         self.target_password = target_password
         
-        # Initialize XML-RPC connections
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.gzip_requests = gzip_requests
+        
+        # Initialize XML-RPC connections; the object proxies are kept per thread
+        # (see get_models_proxy) so they can be used from worker threads
+        self._local = threading.local()
+        
         self.source_common = None
         self.source_models = None
         self.source_uid = None
+        # Web client session used to download attachment payloads, see open_web_session
+        self.source_session = None
         
         self.target_common = None
         self.target_models = None
         self.target_uid = None
         
+        # Target IDs of the records migrated by earlier runs, by model and source
+        # ID; see load_migrated_ids
+        self.migrated_ids = {}
+        
         # Setup logging
         self.setup_logging()
         
-        # Migration statistics
+        # Migration statistics; only updated through record_migrated and
+        # record_error, which guard them with a lock. Every error goes to the log
+        # file; only the most recent ones are kept for the report
+        self._stats_lock = threading.Lock()
         self.migration_stats = {
             'pages_migrated': 0,
             'menus_migrated': 0,
             'themes_migrated': 0,
             'snippets_migrated': 0,
             'assets_migrated': 0,
-            'errors': []
+            'errors_count': 0,
+            'errors': collections.deque(maxlen=1000)
         }
     
     def setup_logging(self):
-        """Setup logging configuration."""
+        """
+        Setup logging configuration.
+        
+        Logging calls only put the record on a queue; a background listener
+        thread formats it and writes it to the log file and the console, so
+        worker threads never wait on the disk or the terminal.
+        """
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(f'migration_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+        file_handler.setFormatter(formatter)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+        self._log_listener.start()
+        
+        # Drop the queue handler of an earlier migrator in this process, whose
+        # listener is no longer running; basicConfig does nothing otherwise
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root_logger.removeHandler(handler)
+        
+        # The queued records are formatted by the listener's handlers
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(f'migration_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
+            format='%(message)s',
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
         self.logger = logging.getLogger(__name__)
     
+    def record_migrated(self, stat: str, count: int = 1):
+        """
+        Add to one of the ``*_migrated`` counters. Safe to call from worker threads.
+        
+        Args:
+            stat: Counter name, e.g. 'pages_migrated'
+            count: Number of migrated records to add
+        """
+        with self._stats_lock:
+            self.migration_stats[stat] += count
+    
+    def record_error(self, error_msg: str):
+        """
+        Count an error and remember it for the report.
+        
+        The caller is expected to have logged the error already. Safe to call from
+        worker threads.
+        """
+        with self._stats_lock:
+            self.migration_stats['errors_count'] += 1
+            self.migration_stats['errors'].append(error_msg)
+    
+    @property
+    def source_models(self):
+        """Object proxy for the source instance (one per thread)."""
+        return self.get_models_proxy('source')
+    
+    @source_models.setter
+    def source_models(self, proxy):
+        self._local.source_models = proxy
+        self._local.source_call = None
+    
+    @property
+    def target_models(self):
+        """Object proxy for the target instance (one per thread)."""
+        return self.get_models_proxy('target')
+    
+    @target_models.setter
+    def target_models(self, proxy):
+        self._local.target_models = proxy
+        self._local.target_call = None
+    
+    @property
+    def source_call(self) -> Callable[..., Any]:
+        """execute_kw of the source instance with the connection bound (one per thread)."""
+        return self.get_rpc_call('source')
+    
+    @property
+    def target_call(self) -> Callable[..., Any]:
+        """execute_kw of the target instance with the connection bound (one per thread)."""
+        return self.get_rpc_call('target')
+    
+    def get_models_proxy(self, side: str) -> xmlrpc.client.ServerProxy:
+        """
+        Return the calling thread's object proxy for the 'source' or 'target' side.
+        
+        ServerProxy is not thread-safe, so worker threads lazily open their own
+        proxy to the same URL.
+        """
+        proxy = getattr(self._local, f'{side}_models', None)
+        if proxy is None:
+            proxy = self.create_server_proxy(getattr(self, f'{side}_url'), 'object')
+            setattr(self._local, f'{side}_models', proxy)
+        return proxy
+    
+    def get_rpc_call(self, side: str) -> Callable[..., Any]:
+        """
+        Return the calling thread's RPC function for the 'source' or 'target' side.
+        
+        The function is ``call(model, method, args, kwargs=None)``. The database,
+        user ID, password and the proxy's execute_kw are bound once per thread
+        instead of being looked up on every call.
+        """
+        call = getattr(self._local, f'{side}_call', None)
+        if call is None:
+            execute_kw = self.get_models_proxy(side).execute_kw
+            db = getattr(self, f'{side}_db')
+            uid = getattr(self, f'{side}_uid')
+            password = getattr(self, f'{side}_password')
+            
+            def call(model, method, args, kwargs=None):
+                return execute_kw(db, uid, password, model, method, args, kwargs or {})
+            
+            setattr(self._local, f'{side}_call', call)
+        return call
+    
+    def create_transport(self, url: str) -> xmlrpc.client.Transport:
+        """
+        Create an XML-RPC transport for an Odoo instance.
+        
+        A transport keeps its HTTP(S) connection open between requests, so proxies
+        that share one also share a single TCP connection and TLS handshake.
+        Gzip-compressed responses are always accepted; requests are only
+        compressed when ``gzip_requests`` is set, since Odoo itself does not
+        decompress request bodies.
+        """
+        if url.startswith('https://'):
+            # Create transport with the shared unverified SSL context
+            transport = xmlrpc.client.SafeTransport(context=_SSL_CTX)
+        else:
+            transport = xmlrpc.client.Transport()
+        
+        transport.accept_gzip_encoding = True
+        if self.gzip_requests:
+            transport.encode_threshold = _GZIP_THRESHOLD
+        return transport
+    
+    def create_server_proxy(self, url: str, endpoint: str,
+                            transport: Optional[xmlrpc.client.Transport] = None) -> xmlrpc.client.ServerProxy:
+        """Create an XML-RPC proxy for one of the /xmlrpc/2 endpoints of an Odoo instance."""
+        if transport is None:
+            transport = self.create_transport(url)
+        return xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/{endpoint}', transport=transport)
+    
     def connect_to_odoo(self, url: str, db: str, username: str, password: str) -> tuple:
         """
         Connect to an Odoo instance using XML-RPC.
@@ -104,33 +351,21 @@ class OdooWebsiteMigrator:
             Exception: If connection fails
         """
         try:
-            # Create SSL context that ignores certificate verification for HTTPS connections
-            import ssl
-            if url.startswith('https://'):
-                # Create SSL context that doesn't verify certificates
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                
-                # Create transport with custom SSL context
-                import xmlrpc.client
-                transport = xmlrpc.client.SafeTransport(context=ssl_context)
-                common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common', transport=transport)
-                models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object', transport=transport)
-            else:
-                common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common')
-                models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object')
+            # Both endpoints share one transport, and with it one kept-alive connection
+            transport = self.create_transport(url)
+            common = self.create_server_proxy(url, 'common', transport)
+            models = self.create_server_proxy(url, 'object', transport)
             
             uid = common.authenticate(db, username, password, {})
             
             if not uid:
                 raise Exception(f"Authentication failed for {url}")
             
-            self.logger.info(f"Successfully connected to {url}")
+            self.logger.info("Successfully connected to %s", url)
             return common, models, uid
             
         except Exception as e:
-            self.logger.error(f"Failed to connect to {url}: {str(e)}")
+            self.logger.error("Failed to connect to %s: %s", url, e)
             raise
     
     def connect_to_source(self):
@@ -139,6 +374,9 @@ class OdooWebsiteMigrator:
         self.source_common, self.source_models, self.source_uid = self.connect_to_odoo(
             self.source_url, self.source_db, self.source_username, self.source_password
         )
+        self.source_session = self.open_web_session(
+            self.source_url, self.source_db, self.source_username, self.source_password
+        )
     
     def connect_to_target(self):
         """Connect to the target Odoo 18 instance."""
@@ -147,12 +385,62 @@ class OdooWebsiteMigrator:
             self.target_url, self.target_db, self.target_username, self.target_password
         )
     
+    def open_web_session(self, url: str, db: str, username: str,
+                         password: str) -> Optional[urllib.request.OpenerDirector]:
+        """
+        Log in to the web client of an Odoo instance.
+        
+        The returned opener carries the session cookie, so it can fetch HTTP routes
+        such as /web/content that are not available over XML-RPC.
+        
+        Returns:
+            The logged-in opener, or None if the login failed
+        """
+        opener = urllib.request.build_opener(
+            urllib.request.HTTPSHandler(context=_SSL_CTX),
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+        request = urllib.request.Request(
+            f'{url}/web/session/authenticate',
+            data=json.dumps({
+                'jsonrpc': '2.0',
+                'method': 'call',
+                'params': {'db': db, 'login': username, 'password': password},
+            }).encode(),
+            headers={'Content-Type': 'application/json'}
+        )
+        
+        try:
+            with opener.open(request) as response:
+                result = json.load(response)
+        except (OSError, ValueError) as e:
+            self.logger.warning("Web session login failed for %s, assets will be read over XML-RPC: %s", url, e)
+            return None
+        
+        if not (result.get('result') or {}).get('uid'):
+            error = result.get('error', {}).get('data', {}).get('message', 'authentication failed')
+            self.logger.warning("Web session login failed for %s, assets will be read over XML-RPC: %s", url, error)
+            return None
+        
+        return opener
+    
+    @disk_memoize
+    def source_execute(self, model: str, method: str, args: List[Any],
+                       kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Call a read method on the source instance.
+        
+        With a ``cache_dir``, results are cached on disk (see disk_memoize), so a
+        re-run of a migration whose source has not changed only does target-side
+        work.
+        """
+        return self.source_call(model, method, args, kwargs)
+    
     def get_website_pages(self) -> List[Dict[str, Any]]:
         """Retrieve all website pages from the source instance."""
         try:
             self.logger.info("Retrieving website pages from source...")
-            pages = self.source_models.execute_kw(
-                self.source_db, self.source_uid, self.source_password,
+            pages = self.source_execute(
                 'website.page', 'search_read',
                 [[('is_published', '=', True)]],
                 {
@@ -162,19 +450,18 @@ class OdooWebsiteMigrator:
                     ]
                 }
             )
-            self.logger.info(f"Found {len(pages)} website pages")
+            self.logger.info("Found %s website pages", len(pages))
             return pages
         except Exception as e:
-            self.logger.error(f"Error retrieving website pages: {str(e)}")
-            self.migration_stats['errors'].append(f"Website pages: {str(e)}")
+            self.logger.error("Error retrieving website pages: %s", e)
+            self.record_error(f"Website pages: {str(e)}")
             return []
     
     def get_website_menus(self) -> List[Dict[str, Any]]:
         """Retrieve all website menus from the source instance."""
         try:
             self.logger.info("Retrieving website menus from source...")
-            menus = self.source_models.execute_kw(
-                self.source_db, self.source_uid, self.source_password,
+            menus = self.source_execute(
                 'website.menu', 'search_read',
                 [[]],
                 {
@@ -184,233 +471,644 @@ class OdooWebsiteMigrator:
                     ]
                 }
             )
-            self.logger.info(f"Found {len(menus)} website menus")
+            self.logger.info("Found %s website menus", len(menus))
             return menus
         except Exception as e:
-            self.logger.error(f"Error retrieving website menus: {str(e)}")
-            self.migration_stats['errors'].append(f"Website menus: {str(e)}")
+            self.logger.error("Error retrieving website menus: %s", e)
+            self.record_error(f"Website menus: {str(e)}")
             return []
     
     def get_website_themes(self) -> List[Dict[str, Any]]:
         """Retrieve website themes from the source instance."""
         try:
             self.logger.info("Retrieving website themes from source...")
-            themes = self.source_models.execute_kw(
-                self.source_db, self.source_uid, self.source_password,
+            themes = self.source_execute(
                 'ir.module.module', 'search_read',
                 [[('name', 'like', 'theme_'), ('state', '=', 'installed')]],
                 {
                     'fields': ['name', 'shortdesc', 'description', 'state']
                 }
             )
-            self.logger.info(f"Found {len(themes)} website themes")
+            self.logger.info("Found %s website themes", len(themes))
             return themes
         except Exception as e:
-            self.logger.error(f"Error retrieving website themes: {str(e)}")
-            self.migration_stats['errors'].append(f"Website themes: {str(e)}")
+            self.logger.error("Error retrieving website themes: %s", e)
+            self.record_error(f"Website themes: {str(e)}")
             return []
     
-    def get_website_assets(self) -> List[Dict[str, Any]]:
-        """Retrieve website assets from the source instance."""
+    def iter_website_assets(self, page_size: int = 200) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Retrieve website assets from the source instance, one page at a time.
+        
+        Pages are fetched with offset/limit as they are consumed, so only one page
+        is held in memory. The asset payloads (``datas``) are not included; they
+        are read by read_asset_datas for the assets that actually get migrated.
+        The pages are not cached on disk, as pages of different ages could skip
+        or repeat assets.
+        
+        Args:
+            page_size: Number of assets per page
+            
+        Yields:
+            Lists of at most ``page_size`` assets
+        """
+        self.logger.info("Retrieving website assets from source...")
+        offset = 0
+        
+        while True:
+            try:
+                assets = self.source_call(
+                    'ir.attachment', 'search_read',
+                    [[('mimetype', 'in', ['text/css', 'application/javascript', 'image/png', 'image/jpeg', 'image/gif', 'image/svg+xml'])]],
+                    {
+                        'fields': ['name', 'type', 'mimetype', 'url', 'res_model', 'res_id', 'checksum'],
+                        'offset': offset,
+                        'limit': page_size,
+                        'order': 'id',
+                    }
+                )
+            except Exception as e:
+                self.logger.error("Error retrieving website assets: %s", e)
+                self.record_error(f"Website assets: {str(e)}")
+                return
+            
+            if assets:
+                yield assets
+            
+            offset += len(assets)
+            if len(assets) < page_size:
+                break
+        
+        self.logger.info("Found %s website assets", offset)
+    
+    def download_attachment(self, attachment_id: int) -> bytes:
+        """
+        Download the raw content of a source attachment from /web/content.
+        
+        This skips the base64 encoding and XML escaping of ``datas`` on the source
+        server and sends a third fewer bytes over the network.
+        """
+        request = urllib.request.Request(
+            f'{self.source_url}/web/content/{attachment_id}?download=1',
+            headers={'Accept-Encoding': 'gzip'}
+        )
+        with self.source_session.open(request) as response:
+            content = response.read()
+            if response.headers.get('Content-Encoding') == 'gzip':
+                content = gzip.decompress(content)
+        return content
+    
+    def read_asset_datas(self, assets: List[Dict[str, Any]]):
+        """
+        Fill in the base64 payload of the given assets from the source instance.
+        
+        Binary payloads are downloaded concurrently over the web session when there
+        is one, and encoded to base64 locally. The remaining payloads are read over
+        XML-RPC in a single call. Assets whose payload could not be read are left
+        without ``datas``. Payloads are never cached on disk, unlike the record
+        reads (see source_execute), as they would copy the whole attachment store.
+        """
+        if self.source_session is not None:
+            def download(asset):
+                try:
+                    return base64.b64encode(self.download_attachment(asset['id'])).decode('ascii')
+                except (OSError, http.client.HTTPException, zlib.error, EOFError) as e:
+                    # URLError is an OSError; truncated or corrupt gzip responses
+                    # raise zlib.error or EOFError
+                    self.logger.warning("Error downloading asset %s, reading it over XML-RPC: %s", asset['name'], e)
+                    return None
+            
+            binary_assets = [asset for asset in assets if asset.get('type') != 'url']
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for asset, datas in zip(binary_assets, executor.map(download, binary_assets)):
+                    if datas is not None:
+                        asset['datas'] = datas
+            
+            assets = [asset for asset in assets if 'datas' not in asset]
+        
+        if not assets:
+            return
+        
+        records = self.source_call(
+            'ir.attachment', 'read',
+            [[asset['id'] for asset in assets]],
+            {'fields': ['datas']}
+        )
+        datas_by_id = {record['id']: record['datas'] for record in records}
+        
+        for asset in assets:
+            if asset['id'] in datas_by_id:
+                asset['datas'] = datas_by_id[asset['id']]
+    
+    def load_migrated_ids(self):
+        """
+        Load the target IDs of the records migrated by earlier runs.
+        
+        Every migrated record gets an XML ID ``__migrator__.<model>_<source ID>``
+        on the target (see save_migrated_ids), so one ir.model.data read tells
+        which source records a re-run can skip without looking each of them up.
+        """
+        self.migrated_ids = {}
         try:
-            self.logger.info("Retrieving website assets from source...")
-            assets = self.source_models.execute_kw(
-                self.source_db, self.source_uid, self.source_password,
-                'ir.attachment', 'search_read',
-                [[('mimetype', 'in', ['text/css', 'application/javascript', 'image/png', 'image/jpeg', 'image/gif', 'image/svg+xml'])]],
-                {
-                    'fields': ['name', 'datas', 'mimetype', 'url', 'res_model', 'res_id']
-                }
+            records = self.target_call(
+                'ir.model.data', 'search_read',
+                [[('module', '=', _XMLID_MODULE)]],
+                {'fields': ['name', 'model', 'res_id']}
             )
-            self.logger.info(f"Found {len(assets)} website assets")
-            return assets
         except Exception as e:
-            self.logger.error(f"Error retrieving website assets: {str(e)}")
-            self.migration_stats['errors'].append(f"Website assets: {str(e)}")
-            return []
+            self.logger.warning("Error loading the records migrated by earlier runs: %s", e)
+            return
+        
+        for record in records:
+            prefix, _, source_id = record['name'].rpartition('_')
+            if prefix == record['model'].replace('.', '_') and source_id.isdigit():
+                self.migrated_ids.setdefault(record['model'], {})[int(source_id)] = record['res_id']
+        
+        self.logger.info("Found %s records migrated by earlier runs", len(records))
+    
+    def save_migrated_ids(self, model: str, id_pairs: List[tuple]):
+        """
+        Give newly created target records an XML ID naming their source record.
+        
+        Records whose XML ID can't be created are still migrated; a re-run just
+        falls back to looking them up by URL or name.
+        
+        Args:
+            model: Model of the records
+            id_pairs: (source ID, target ID) of every created record
+        """
+        prefix = model.replace('.', '_')
+        results = self.create_records('ir.model.data', [
+            {
+                'module': _XMLID_MODULE,
+                'name': f'{prefix}_{source_id}',
+                'model': model,
+                'res_id': target_id,
+                'noupdate': True,
+            }
+            for source_id, target_id in id_pairs
+        ], batch_size=1000)
+        
+        migrated_ids = self.migrated_ids.setdefault(model, {})
+        failed = 0
+        for (source_id, target_id), result in zip(id_pairs, results):
+            if isinstance(result, Exception):
+                failed += 1
+            else:
+                migrated_ids[source_id] = target_id
+        
+        if failed:
+            self.logger.warning("Error creating XML IDs for %s of %s migrated %s records", failed, len(id_pairs), model)
+    
+    def get_existing_records(self, model: str, field: str, values: Iterable[Any],
+                             fields: List[str]) -> List[Dict[str, Any]]:
+        """
+        Read the target records whose ``field`` is one of ``values``.
+        
+        This replaces one existence probe per record with a single search_read per
+        thousand values.
+        
+        Args:
+            model: Target model name
+            field: Field to match against
+            values: Values to look up; duplicates are only sent once
+            fields: Fields to read from the matching records
+            
+        Returns:
+            The matching records
+        """
+        records = []
+        for batch in chunked(dict.fromkeys(values), 1000):
+            records.extend(self.target_call(
+                model, 'search_read',
+                [[(field, 'in', batch)]],
+                {'fields': fields}
+            ))
+        return records
+    
+    def create_records(self, model: str, vals_list: List[Dict[str, Any]], batch_size: int = 200) -> List[Any]:
+        """
+        Create records in the target instance in batches.
+        
+        Odoo's create accepts a list of value dicts, so every batch of
+        ``batch_size`` records costs a single round-trip, and the batches are sent
+        concurrently from a pool of threads. When a batch fails its records are
+        retried one at a time, so one bad record doesn't take the rest of the
+        batch down with it.
+        
+        Args:
+            model: Target model name
+            vals_list: Values for the records to create
+            batch_size: Maximum number of records per create call
+            
+        Returns:
+            One entry per value dict: the new record ID, or the exception raised
+            while creating that record
+        """
+        def create_batch(batch):
+            try:
+                return self.target_call(
+                    model, 'create',
+                    [batch]
+                )
+            except Exception as e:
+                if len(batch) == 1:
+                    return [e]
+                self.logger.warning("Batch create of %s %s records failed, retrying one by one: %s", len(batch), model, e)
+            
+            batch_results = []
+            for vals in batch:
+                try:
+                    batch_results.append(self.target_call(
+                        model, 'create',
+                        [vals]
+                    ))
+                except Exception as e:
+                    batch_results.append(e)
+            return batch_results
+        
+        results = []
+        
+        # map keeps the batches in order, so results line up with vals_list
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch_results in executor.map(create_batch, chunked(vals_list, batch_size)):
+                results.extend(batch_results)
+        
+        return results
     
     def migrate_website_pages(self, pages: List[Dict[str, Any]]):
         """Migrate website pages to the target instance."""
         self.logger.info("Starting website pages migration...")
         
+        # Pages migrated by an earlier run are known by their XML ID; only the
+        # others are looked up by URL
+        migrated_ids = self.migrated_ids.get('website.page', {})
+        if migrated_ids:
+            self.logger.info("Skipping pages migrated by an earlier run...")
+            pages = [page for page in pages if page['id'] not in migrated_ids]
+        
+        # Look up all pages that already exist in one go
+        try:
+            existing_urls = {
+                record['url']
+                for record in self.get_existing_records('website.page', 'url', [p['url'] for p in pages], ['url'])
+            }
+        except Exception as e:
+            error_msg = f"Error checking existing pages: {str(e)}"
+            self.logger.error(error_msg)
+            self.record_error(error_msg)
+            return
+        
+        def make_page_data(page):
+            # search_read returns every requested field, so only the values of
+            # the content fields need checking, not their presence
+            page_data = {
+                'name': page['name'],
+                'url': page['url'],
+                'is_published': page['is_published'],
+            }
+            if page['arch_db']:
+                page_data['arch_db'] = page['arch_db']
+            elif page['arch']:
+                page_data['arch'] = page['arch']
+            return page_data
+        
+        # (page, page_data) for every page that needs to be created
+        prepared = []
+        
         for page in pages:
             try:
-                # Check if page already exists in target
-                existing_page = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'website.page', 'search_read',
-                    [[('url', '=', page['url'])]],
-                    {'fields': ['id']}
-                )
-                
-                if existing_page:
-                    self.logger.info(f"Page {page['name']} already exists, skipping...")
+                # Check if page already exists in target, or is about to be created
+                if page['url'] in existing_urls:
+                    self.logger.info("Page %s already exists, skipping...", page['name'])
                     continue
+                existing_urls.add(page['url'])
                 
-                # Prepare page data for migration
-                page_data = {
-                    'name': page['name'],
-                    'url': page['url'],
-                    'is_published': page.get('is_published', True),
-                }
-                
-                # Handle content based on available fields
-                if 'arch_db' in page and page['arch_db']:
-                    page_data['arch_db'] = page['arch_db']
-                elif 'arch' in page and page['arch']:
-                    page_data['arch'] = page['arch']
-                
-                # Create page in target
-                new_page_id = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'website.page', 'create',
-                    [page_data]
-                )
-                
-                self.logger.info(f"Successfully migrated page: {page['name']} (ID: {new_page_id})")
-                self.migration_stats['pages_migrated'] += 1
+                prepared.append((page, make_page_data(page)))
                 
             except Exception as e:
                 error_msg = f"Error migrating page {page.get('name', 'Unknown')}: {str(e)}"
                 self.logger.error(error_msg)
-                self.migration_stats['errors'].append(error_msg)
+                self.record_error(error_msg)
+        
+        # Create pages in target
+        new_page_ids = self.create_records('website.page', [page_data for _, page_data in prepared])
+        created = []
+        
+        for (page, _), new_page_id in zip(prepared, new_page_ids):
+            if isinstance(new_page_id, Exception):
+                error_msg = f"Error migrating page {page.get('name', 'Unknown')}: {str(new_page_id)}"
+                self.logger.error(error_msg)
+                self.record_error(error_msg)
+                continue
+            
+            self.logger.info("Successfully migrated page: %s (ID: %s)", page['name'], new_page_id)
+            self.record_migrated('pages_migrated')
+            created.append((page['id'], new_page_id))
+        
+        self.save_migrated_ids('website.page', created)
     
     def migrate_website_menus(self, menus: List[Dict[str, Any]]):
-        """Migrate website menus to the target instance."""
+        """
+        Migrate website menus to the target instance.
+        
+        Menus are created one tree level at a time with one create call per level,
+        so parents always exist before their children.
+        """
         self.logger.info("Starting website menus migration...")
         
-        # Create a mapping of old menu IDs to new menu IDs
-        menu_id_mapping = {}
+        # Menus migrated by an earlier run are known by their XML ID and still
+        # serve as parents of new menus; only the others are looked up by name
+        migrated_ids = self.migrated_ids.get('website.menu', {})
+        menu_id_mapping = {menu['id']: migrated_ids[menu['id']] for menu in menus if menu['id'] in migrated_ids}
         
-        for menu in menus:
-            try:
-                # Check if menu already exists
-                existing_menu = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'website.menu', 'search_read',
-                    [[('name', '=', menu['name']), ('url', '=', menu.get('url', ''))]],
-                    {'fields': ['id']}
+        # Look up all menus that already exist in one go
+        try:
+            existing_menus = {
+                (record['name'], record['url'] or '')
+                for record in self.get_existing_records(
+                    'website.menu', 'name', [m['name'] for m in menus if m['id'] not in menu_id_mapping], ['name', 'url']
                 )
-                
-                if existing_menu:
-                    self.logger.info(f"Menu {menu['name']} already exists, skipping...")
+            }
+        except Exception as e:
+            error_msg = f"Error checking existing menus: {str(e)}"
+            self.logger.error(error_msg)
+            self.record_error(error_msg)
+            return
+        
+        for level in self.group_menus_by_level(menus):
+            # (menu, menu_data) for every menu of this level that needs to be created
+            prepared = []
+            
+            for menu in level:
+                if menu['id'] in menu_id_mapping:
+                    self.logger.info("Menu %s was migrated by an earlier run, skipping...", menu['name'])
                     continue
                 
-                # Prepare menu data
-                menu_data = {
-                    'name': menu['name'],
-                    'url': menu.get('url', ''),
-                    'sequence': menu.get('sequence', 10),
-                    'is_visible': menu.get('is_visible', True),
-                    'is_mega_menu': menu.get('is_mega_menu', False),
-                }
-                
-                # Handle parent menu mapping
-                if menu.get('parent_id') and menu['parent_id'][0] in menu_id_mapping:
-                    menu_data['parent_id'] = menu_id_mapping[menu['parent_id'][0]]
-                
-                # Create menu in target
-                new_menu_id = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'website.menu', 'create',
-                    [menu_data]
-                )
+                try:
+                    # Check if menu already exists, or is about to be created
+                    menu_key = (menu['name'], menu.get('url') or '')
+                    if menu_key in existing_menus:
+                        self.logger.info("Menu %s already exists, skipping...", menu['name'])
+                        continue
+                    existing_menus.add(menu_key)
+                    
+                    # Prepare menu data
+                    menu_data = {
+                        'name': menu['name'],
+                        'url': menu.get('url', ''),
+                        'sequence': menu.get('sequence', 10),
+                        'is_visible': menu.get('is_visible', True),
+                        'is_mega_menu': menu.get('is_mega_menu', False),
+                    }
+                    
+                    # Handle parent menu mapping
+                    if menu.get('parent_id') and menu['parent_id'][0] in menu_id_mapping:
+                        menu_data['parent_id'] = menu_id_mapping[menu['parent_id'][0]]
+                    
+                    prepared.append((menu, menu_data))
+                    
+                except Exception as e:
+                    error_msg = f"Error migrating menu {menu.get('name', 'Unknown')}: {str(e)}"
+                    self.logger.error(error_msg)
+                    self.record_error(error_msg)
+            
+            # Create this level's menus in target
+            new_menu_ids = self.create_records('website.menu', [menu_data for _, menu_data in prepared])
+            created = []
+            
+            for (menu, _), new_menu_id in zip(prepared, new_menu_ids):
+                if isinstance(new_menu_id, Exception):
+                    error_msg = f"Error migrating menu {menu.get('name', 'Unknown')}: {str(new_menu_id)}"
+                    self.logger.error(error_msg)
+                    self.record_error(error_msg)
+                    continue
                 
                 # Store mapping for child menus
                 menu_id_mapping[menu['id']] = new_menu_id
                 
-                self.logger.info(f"Successfully migrated menu: {menu['name']} (ID: {new_menu_id})")
-                self.migration_stats['menus_migrated'] += 1
-                
-            except Exception as e:
-                error_msg = f"Error migrating menu {menu.get('name', 'Unknown')}: {str(e)}"
-                self.logger.error(error_msg)
-                self.migration_stats['errors'].append(error_msg)
+                self.logger.info("Successfully migrated menu: %s (ID: %s)", menu['name'], new_menu_id)
+                self.record_migrated('menus_migrated')
+                created.append((menu['id'], new_menu_id))
+            
+            self.save_migrated_ids('website.menu', created)
+    
+    def group_menus_by_level(self, menus: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Group menus by their depth in the menu tree, roots first.
+        
+        Menus whose parent is not part of ``menus`` count as roots. Menus that
+        can't be reached from a root because their parents form a cycle are put
+        in a last group of their own.
+        
+        Args:
+            menus: Source menus
+            
+        Returns:
+            Lists of menus, one per tree level
+        """
+        menu_ids = {menu['id'] for menu in menus}
+        children = {}
+        level = []
+        
+        for menu in menus:
+            parent_id = menu['parent_id'][0] if menu.get('parent_id') else None
+            if parent_id in menu_ids:
+                children.setdefault(parent_id, []).append(menu)
+            else:
+                level.append(menu)
+        
+        levels = []
+        while level:
+            levels.append(level)
+            level = [child for menu in level for child in children.pop(menu['id'], [])]
+        
+        unreachable = [menu for group in children.values() for menu in group]
+        if unreachable:
+            levels.append(unreachable)
+        
+        return levels
     
     def migrate_website_themes(self, themes: List[Dict[str, Any]]):
         """Migrate website themes to the target instance."""
         self.logger.info("Starting website themes migration...")
         
-        for theme in themes:
-            try:
-                # Check if theme is already installed in target
-                existing_theme = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'ir.module.module', 'search_read',
-                    [[('name', '=', theme['name'])]],
-                    {'fields': ['state']}
-                )
-                
-                if existing_theme and existing_theme[0]['state'] == 'installed':
-                    self.logger.info(f"Theme {theme['name']} already installed, skipping...")
-                    continue
-                
-                # Try to install the theme - use search to get the module ID first
-                module_ids = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'ir.module.module', 'search',
-                    [[('name', '=', theme['name'])]]
+        # Look up the ID and state of all themes in the target in one go
+        try:
+            target_modules = {
+                record['name']: record
+                for record in self.get_existing_records(
+                    'ir.module.module', 'name', [t['name'] for t in themes], ['name', 'state']
                 )
-                
-                if module_ids:
-                    # Try to install the theme
-                    self.target_models.execute_kw(
-                        self.target_db, self.target_uid, self.target_password,
-                        'ir.module.module', 'button_immediate_install',
-                        [module_ids]
-                    )
-                else:
-                    self.logger.warning(f"Theme {theme['name']} not found in target instance")
-                    continue
-                
-                self.logger.info(f"Successfully installed theme: {theme['name']}")
-                self.migration_stats['themes_migrated'] += 1
-                
-            except Exception as e:
+            }
+        except Exception as e:
+            error_msg = f"Error checking existing themes: {str(e)}"
+            self.logger.error(error_msg)
+            self.record_error(error_msg)
+            return
+        
+        # (theme, module_id) for every theme that needs to be installed
+        to_install = []
+        
+        for theme in themes:
+            target_module = target_modules.get(theme['name'])
+            
+            # Check if theme is already installed in target
+            if target_module and target_module['state'] == 'installed':
+                self.logger.info("Theme %s already installed, skipping...", theme['name'])
+                continue
+            
+            if not target_module:
+                self.logger.warning("Theme %s not found in target instance", theme['name'])
+                continue
+            
+            to_install.append((theme, target_module['id']))
+        
+        if not to_install:
+            return
+        
+        # Install all themes with one call, so the server goes through a single
+        # upgrade and registry reload; fall back to one call per theme if it fails
+        try:
+            self.target_call(
+                'ir.module.module', 'button_immediate_install',
+                [[module_id for _, module_id in to_install]]
+            )
+            installed = [theme for theme, _ in to_install]
+        except Exception as e:
+            if len(to_install) == 1:
+                theme = to_install[0][0]
                 error_msg = f"Error installing theme {theme.get('name', 'Unknown')}: {str(e)}"
                 self.logger.error(error_msg)
-                self.migration_stats['errors'].append(error_msg)
+                self.record_error(error_msg)
+                return
+            
+            self.logger.warning("Installing %s themes at once failed, retrying one by one: %s", len(to_install), e)
+            installed = []
+            for theme, module_id in to_install:
+                try:
+                    self.target_call(
+                        'ir.module.module', 'button_immediate_install',
+                        [[module_id]]
+                    )
+                    installed.append(theme)
+                except Exception as e:
+                    error_msg = f"Error installing theme {theme.get('name', 'Unknown')}: {str(e)}"
+                    self.logger.error(error_msg)
+                    self.record_error(error_msg)
+        
+        for theme in installed:
+            self.logger.info("Successfully installed theme: %s", theme['name'])
+            self.record_migrated('themes_migrated')
     
     def migrate_website_assets(self, assets: List[Dict[str, Any]]):
-        """Migrate website assets to the target instance."""
-        self.logger.info("Starting website assets migration...")
+        """
+        Migrate a page of website assets to the target instance.
+        
+        The payloads are only read from the source for the assets that don't
+        exist in the target yet. Assets with the same content (the same source
+        checksum) are read and uploaded once; the others are copied from the
+        uploaded attachment on the target, which reuses its stored file.
+        """
+        self.logger.info("Migrating %s website assets...", len(assets))
+        
+        # Assets migrated by an earlier run are known by their XML ID; only the
+        # others are looked up by name
+        migrated_ids = self.migrated_ids.get('ir.attachment', {})
+        assets = [asset for asset in assets if asset['id'] not in migrated_ids]
+        
+        # Look up all assets that already exist in one go
+        try:
+            existing_names = {
+                record['name']
+                for record in self.get_existing_records('ir.attachment', 'name', [a['name'] for a in assets], ['name'])
+            }
+        except Exception as e:
+            error_msg = f"Error checking existing assets: {str(e)}"
+            self.logger.error(error_msg)
+            self.record_error(error_msg)
+            return
         
+        # Keep the assets that don't exist yet and aren't about to be created
+        new_assets = []
         for asset in assets:
+            if asset['name'] in existing_names:
+                self.logger.info("Asset %s already exists, skipping...", asset['name'])
+                continue
+            existing_names.add(asset['name'])
+            new_assets.append(asset)
+        
+        # (asset, asset_data) for every asset that needs to be created; the
+        # payload is filled in below. search_read returns every requested field,
+        # so they can be copied without checks
+        prepared = [
+            (asset, {'name': asset['name'], 'mimetype': asset['mimetype'], 'url': asset['url']})
+            for asset in new_assets
+        ]
+        
+        # Group the new assets by content; only the first of each group is uploaded
+        groups = {}
+        for asset, asset_data in prepared:
+            groups.setdefault(asset.get('checksum') or ('id', asset['id']), []).append((asset, asset_data))
+        uploads = [group[0] for group in groups.values()]
+        
+        # Read the payloads of the new assets only
+        try:
+            self.read_asset_datas([asset for asset, _ in uploads])
+        except Exception as e:
+            for asset, _ in prepared:
+                error_msg = f"Error migrating asset {asset.get('name', 'Unknown')}: {str(e)}"
+                self.logger.error(error_msg)
+                self.record_error(error_msg)
+            return
+        
+        for asset, asset_data in uploads:
+            asset_data['datas'] = asset.pop('datas', '')
+        
+        # Create assets in target; payloads are large, so fewer go in each call
+        new_asset_ids = self.create_records('ir.attachment', [asset_data for _, asset_data in uploads], batch_size=50)
+        
+        # (asset, asset_data, uploaded attachment ID) for every duplicate to copy
+        copies = []
+        created = []
+        
+        for group, new_asset_id in zip(groups.values(), new_asset_ids):
+            if isinstance(new_asset_id, Exception):
+                for asset, _ in group:
+                    error_msg = f"Error migrating asset {asset.get('name', 'Unknown')}: {str(new_asset_id)}"
+                    self.logger.error(error_msg)
+                    self.record_error(error_msg)
+                continue
+            
+            asset = group[0][0]
+            self.logger.info("Successfully migrated asset: %s (ID: %s)", asset['name'], new_asset_id)
+            self.record_migrated('assets_migrated')
+            created.append((asset['id'], new_asset_id))
+            copies.extend((asset, asset_data, new_asset_id) for asset, asset_data in group[1:])
+        
+        def copy_asset(duplicate):
+            asset, asset_data, source_id = duplicate
             try:
-                # Check if asset already exists
-                existing_asset = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'ir.attachment', 'search_read',
-                    [[('name', '=', asset['name'])]],
-                    {'fields': ['id']}
+                return self.target_call(
+                    'ir.attachment', 'copy', [source_id], {'default': asset_data}
                 )
-                
-                if existing_asset:
-                    self.logger.info(f"Asset {asset['name']} already exists, skipping...")
+            except Exception as e:
+                return e
+        
+        # Copies carry no payload, so they are cheap and can run concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for (asset, _, _), new_asset_id in zip(copies, executor.map(copy_asset, copies)):
+                if isinstance(new_asset_id, Exception):
+                    error_msg = f"Error migrating asset {asset.get('name', 'Unknown')}: {str(new_asset_id)}"
+                    self.logger.error(error_msg)
+                    self.record_error(error_msg)
                     continue
                 
-                # Prepare asset data
-                asset_data = {
-                    'name': asset['name'],
-                    'mimetype': asset['mimetype'],
-                    'datas': asset.get('datas', ''),
-                    'url': asset.get('url', ''),
-                }
-                
-                # Create asset in target
-                new_asset_id = self.target_models.execute_kw(
-                    self.target_db, self.target_uid, self.target_password,
-                    'ir.attachment', 'create',
-                    [asset_data]
-                )
-                
-                self.logger.info(f"Successfully migrated asset: {asset['name']} (ID: {new_asset_id})")
-                self.migration_stats['assets_migrated'] += 1
-                
-            except Exception as e:
-                error_msg = f"Error migrating asset {asset.get('name', 'Unknown')}: {str(e)}"
-                self.logger.error(error_msg)
-                self.migration_stats['errors'].append(error_msg)
+                self.logger.info("Successfully migrated asset: %s (ID: %s)", asset['name'], new_asset_id)
+                self.record_migrated('assets_migrated')
+                created.append((asset['id'], new_asset_id))
+        
+        self.save_migrated_ids('ir.attachment', created)
     
     def generate_migration_report(self):
         """Generate a comprehensive migration report."""
@@ -425,13 +1123,17 @@ Migration Statistics:
 - Themes migrated: {self.migration_stats['themes_migrated']}
 - Assets migrated: {self.migration_stats['assets_migrated']}
 
-Errors ({len(self.migration_stats['errors'])}):
+Errors ({self.migration_stats['errors_count']}):
 """
         
+        omitted = self.migration_stats['errors_count'] - len(self.migration_stats['errors'])
+        if omitted:
+            report += f"- {omitted} earlier errors omitted, see the log file\n"
+        
         for error in self.migration_stats['errors']:
             report += f"- {error}\n"
         
-        if not self.migration_stats['errors']:
+        if not self.migration_stats['errors_count']:
             report += "- No errors encountered\n"
         
         # Save report to file
@@ -439,7 +1141,7 @@ Errors ({len(self.migration_stats['errors'])}):
         with open(report_filename, 'w') as f:
             f.write(report)
         
-        self.logger.info(f"Migration report saved to: {report_filename}")
+        self.logger.info("Migration report saved to: %s", report_filename)
         print(report)
     
     def run_migration(self):
@@ -450,19 +1152,24 @@ Errors ({len(self.migration_stats['errors'])}):
             # Connect to both instances
             self.connect_to_source()
             self.connect_to_target()
+            self.load_migrated_ids()
             
-            # Migrate website data
-            pages = self.get_website_pages()
-            self.migrate_website_pages(pages)
-            
-            menus = self.get_website_menus()
-            self.migrate_website_menus(menus)
+            # The source fetches are independent and mostly wait on the network,
+            # so they run concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                pages = executor.submit(self.get_website_pages)
+                menus = executor.submit(self.get_website_menus)
+                themes = executor.submit(self.get_website_themes)
             
-            themes = self.get_website_themes()
-            self.migrate_website_themes(themes)
+            # Migrate website data
+            self.migrate_website_pages(pages.result())
+            self.migrate_website_menus(menus.result())
+            self.migrate_website_themes(themes.result())
             
-            assets = self.get_website_assets()
-            self.migrate_website_assets(assets)
+            # Assets are fetched and migrated one page at a time
+            self.logger.info("Starting website assets migration...")
+            for assets in self.iter_website_assets():
+                self.migrate_website_assets(assets)
             
             # Generate report
             self.generate_migration_report()
@@ -470,8 +1177,11 @@ Errors ({len(self.migration_stats['errors'])}):
             self.logger.info("Migration completed successfully!")
             
         except Exception as e:
-            self.logger.error(f"Migration failed: {str(e)}")
+            self.logger.error("Migration failed: %s", e)
             raise
+        finally:
+            # Let the listener write out the queued records before returning
+            self._log_listener.stop()
 
 
 def main():
@@ -488,6 +1198,11 @@ def main():
     parser.add_argument('--target-username', required=True, help='Target username')
     parser.add_argument('--target-password', help='Target password (will prompt if not provided)')
     
+    parser.add_argument('--max-workers', type=int, default=8, help='Number of threads used for concurrent RPC calls')
+    parser.add_argument('--cache', action='store_true', help='Cache source reads in the .migrator_cache directory for re-runs')
+    parser.add_argument('--cache-ttl', type=float, default=86400, help='Seconds after which cached source reads are refetched')
+    parser.add_argument('--gzip-requests', action='store_true', help='Gzip-compress large XML-RPC requests (the server must decompress them)')
+    
     args = parser.parse_args()
     
     # Get passwords if not provided
@@ -503,7 +1218,11 @@ def main():
         target_url=args.target_url,
         target_db=args.target_db,
         target_username=args.target_username,
-        target_password=target_password
+        target_password=target_password,
+        max_workers=args.max_workers,
+        cache_dir='.migrator_cache' if args.cache else None,
+        cache_ttl=args.cache_ttl,
+        gzip_requests=args.gzip_requests
     )
     
     try:
@@ -4,76 +4,231 @@ Test script for Odoo Website Migrator
 =====================================
 
 This script tests the connection and basic functionality of the migration tool.
+Both instances are tested at the same time.
 """
 
+import argparse
+import asyncio
+import hashlib
+import http.client
+import os
+import ssl
+import threading
+import time
+import urllib.parse
 import xmlrpc.client
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    # orjson is a much faster JSON library, used for the config and result
+    # files when it is installed
+    import orjson
+except ImportError:
+    orjson = None
 
-def test_odoo_connection(url: str, db: str, username: str, password: str) -> bool:
+
+# Models whose access is checked by test_website_models, with their results keys
+WEBSITE_MODELS = {
+    'website_page': 'website.page',
+    'website_menu': 'website.menu',
+    'ir_module_module': 'ir.module.module',
+    'ir_attachment': 'ir.attachment',
+}
+
+# With --reuse-recent, a successful test result of the same URL, database and
+# user is reused for this many seconds, see load_cached_result
+CACHE_DIR = os.path.expanduser('~/.cache/odoo_migrator')
+CACHE_TTL = 300
+
+# Outcomes of test_odoo_connection
+CONNECTION_OK = 'ok'
+CONNECTION_AUTH_FAILED = 'auth'        # Reached the server, but the login was refused
+CONNECTION_UNREACHABLE = 'network'     # DNS, TCP, TLS or HTTP failure, or endpoint blocked
+CONNECTION_ERROR = 'error'             # Server error, e.g. an unknown database
+
+# SSL context that ignores certificate verification for HTTPS connections;
+# loading the CA bundle is slow, so it is built once and shared by all connections
+_INSECURE_CTX = ssl.create_default_context()
+_INSECURE_CTX.check_hostname = False
+_INSECURE_CTX.verify_mode = ssl.CERT_NONE
+
+
+class OdooSession:
+    """
+    Connection to one Odoo instance, shared by all of its tests.
+    
+    Calls go to the /jsonrpc endpoint, which is much smaller on the wire than
+    XML-RPC and is parsed by the C-accelerated json module. Every thread keeps
+    one HTTP(S) connection open between its calls (http.client connections are
+    not thread-safe), and the user is only authenticated once.
+    """
+    
+    def __init__(self, url: str, db: str, username: str, password: str):
+        """
+        Set up the session; nothing is sent until the first call.
+        
+        Args:
+            url: Odoo instance URL
+            db: Database name
+            username: Username
+            password: Password
+        """
+        self.url = url
+        self.db = db
+        self.username = username
+        self.password = password
+        self.uid = None
+        
+        parts = urllib.parse.urlsplit(url)
+        self.host = parts.netloc
+        self.path = parts.path.rstrip('/') + '/jsonrpc'
+        self.ctx = _INSECURE_CTX if parts.scheme == 'https' else None
+        self._local = threading.local()
+    
+    @property
+    def connection(self) -> http.client.HTTPConnection:
+        """Kept-alive connection of the calling thread, opened on first use."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if self.ctx is not None:
+                connection = http.client.HTTPSConnection(self.host, context=self.ctx)
+            else:
+                connection = http.client.HTTPConnection(self.host)
+            self._local.connection = connection
+        return connection
+    
+    def close(self):
+        """Close the connection of the calling thread."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+    
+    def call(self, service: str, method: str, *args) -> Any:
+        """
+        Call a method of a JSON-RPC service of the instance.
+        
+        Args:
+            service: 'common' or 'object'
+            method: Method name, e.g. 'authenticate' or 'execute_kw'
+            *args: Positional arguments of the method
+            
+        Returns:
+            The result of the call
+            
+        Raises:
+            xmlrpc.client.Fault: If the server reports an error
+            xmlrpc.client.ProtocolError: If the HTTP request fails
+        """
+        body = json.dumps({
+            'jsonrpc': '2.0',
+            'method': 'call',
+            'id': 1,
+            'params': {'service': service, 'method': method, 'args': args},
+        }).encode()
+        headers = {'Content-Type': 'application/json'}
+        
+        # Retry once if the server closed the idle connection, like xmlrpc.client does
+        for attempt in range(2):
+            connection = self.connection
+            try:
+                connection.request('POST', self.path, body, headers)
+                response = connection.getresponse()
+                payload = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    ConnectionAbortedError, BrokenPipeError):
+                self.close()
+                if attempt:
+                    raise
+            except Exception:
+                # Any other failure, e.g. a bad status line or an SSL error, leaves
+                # the connection midway through a request, so it can't be reused
+                self.close()
+                raise
+        
+        if response.status != 200:
+            raise xmlrpc.client.ProtocolError(self.url + '/jsonrpc', response.status,
+                                              response.reason, dict(response.getheaders()))
+        
+        result = json.loads(payload)
+        if result.get('error'):
+            error = result['error']
+            message = (error.get('data') or {}).get('message') or error.get('message', '')
+            raise xmlrpc.client.Fault(error.get('code', 0), message)
+        return result.get('result')
+    
+    def authenticate(self) -> int:
+        """Authenticate on the first call and return the user ID (False if refused)."""
+        if self.uid is None:
+            self.uid = self.call('common', 'authenticate', self.db, self.username, self.password, {})
+        return self.uid
+    
+    def version(self) -> Dict[str, Any]:
+        """Return the server version information."""
+        return self.call('common', 'version')
+    
+    def search_count(self, model: str) -> int:
+        """Count the records of a model; safe to call from any thread."""
+        return self.call('object', 'execute_kw', self.db, self.authenticate(), self.password,
+                         model, 'search_count', [[]])
+
+
+def test_odoo_connection(session: OdooSession, output: List[str]) -> str:
     """
     Test connection to an Odoo instance.
     
     Args:
-        url: Odoo instance URL
-        db: Database name
-        username: Username
-        password: Password
+        session: Connection to the instance
+        output: List the report lines are appended to
         
     Returns:
-        True if connection successful, False otherwise
+        CONNECTION_OK if connection successful, otherwise CONNECTION_AUTH_FAILED,
+        CONNECTION_UNREACHABLE or CONNECTION_ERROR depending on the failure
     """
+    url = session.url
     try:
-        print(f"Testing connection to {url}...")
-        
-        # Create SSL context that ignores certificate verification for HTTPS connections
-        import ssl
-        if url.startswith('https://'):
-            # Create SSL context that doesn't verify certificates
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            # Create transport with custom SSL context
-            import xmlrpc.client
-            transport = xmlrpc.client.SafeTransport(context=ssl_context)
-            common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common', transport=transport)
-            models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object', transport=transport)
-        else:
-            common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common')
-            models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object')
+        output.append(f"Testing connection to {url}...")
         
-        uid = common.authenticate(db, username, password, {})
+        uid = session.authenticate()
         
         if not uid:
-            print(f"❌ Authentication failed for {url}")
-            return False
+            output.append(f"❌ Authentication failed for {url}")
+            return CONNECTION_AUTH_FAILED
         
         # Test basic model access
-        version_info = common.version()
-        print(f"✅ Successfully connected to {url}")
-        print(f"   Odoo version: {version_info.get('server_version', 'Unknown')}")
-        print(f"   Database: {db}")
-        print(f"   User ID: {uid}")
+        version_info = session.version()
+        output.append(f"✅ Successfully connected to {url}")
+        output.append(f"   Odoo version: {version_info.get('server_version', 'Unknown')}")
+        output.append(f"   Database: {session.db}")
+        output.append(f"   User ID: {uid}")
         
-        return True
+        return CONNECTION_OK
         
+    except (OSError, http.client.HTTPException, xmlrpc.client.ProtocolError) as e:
+        # OSError covers DNS, refused and reset connections, timeouts and TLS errors
+        output.append(f"❌ Connection failed to {url}: {str(e)}")
+        return CONNECTION_UNREACHABLE
     except Exception as e:
-        print(f"❌ Connection failed to {url}: {str(e)}")
-        return False
+        output.append(f"❌ Connection failed to {url}: {str(e)}")
+        return CONNECTION_ERROR
 
 
-def test_website_models(url: str, db: str, username: str, password: str) -> dict:
+async def test_website_models(session: OdooSession, output: List[str]) -> dict:
     """
     Test access to website-related models.
     
+    The models are probed concurrently, each on a worker thread of the event
+    loop's default executor. The user must have been authenticated already,
+    see test_odoo_connection.
+    
     Args:
-        url: Odoo instance URL
-        db: Database name
-        username: Username
-        password: Password
+        session: Connection to the instance
+        output: List the report lines are appended to
         
     Returns:
         Dictionary with test results
@@ -84,77 +239,189 @@ def test_website_models(url: str, db: str, username: str, password: str) -> dict
         'ir_module_module': False,
         'ir_attachment': False
     }
+    loop = asyncio.get_running_loop()
     
     try:
-        # Create SSL context that ignores certificate verification for HTTPS connections
-        import ssl
-        if url.startswith('https://'):
-            # Create SSL context that doesn't verify certificates
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            # Create transport with custom SSL context
-            import xmlrpc.client
-            transport = xmlrpc.client.SafeTransport(context=ssl_context)
-            models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object', transport=transport)
-            common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common', transport=transport)
-        else:
-            models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object')
-            common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common')
-        uid = common.authenticate(db, username, password, {})
-        
-        # Test website.page model
-        try:
-            pages = models.execute_kw(db, uid, password, 'website.page', 'search_count', [[]])
-            results['website_page'] = True
-            print(f"✅ website.page model accessible ({pages} pages found)")
-        except Exception as e:
-            print(f"❌ website.page model not accessible: {str(e)}")
-        
-        # Test website.menu model
-        try:
-            menus = models.execute_kw(db, uid, password, 'website.menu', 'search_count', [[]])
-            results['website_menu'] = True
-            print(f"✅ website.menu model accessible ({menus} menus found)")
-        except Exception as e:
-            print(f"❌ website.menu model not accessible: {str(e)}")
-        
-        # Test ir.module.module model
-        try:
-            modules = models.execute_kw(db, uid, password, 'ir.module.module', 'search_count', [[]])
-            results['ir_module_module'] = True
-            print(f"✅ ir.module.module model accessible ({modules} modules found)")
-        except Exception as e:
-            print(f"❌ ir.module.module model not accessible: {str(e)}")
-        
-        # Test ir.attachment model
-        try:
-            attachments = models.execute_kw(db, uid, password, 'ir.attachment', 'search_count', [[]])
-            results['ir_attachment'] = True
-            print(f"✅ ir.attachment model accessible ({attachments} attachments found)")
-        except Exception as e:
-            print(f"❌ ir.attachment model not accessible: {str(e)}")
+        # Probe all models at once; failures come back as exceptions
+        counts = await asyncio.gather(*(
+            loop.run_in_executor(None, session.search_count, model)
+            for model in WEBSITE_MODELS.values()
+        ), return_exceptions=True)
+        
+        for (key, model), count in zip(WEBSITE_MODELS.items(), counts):
+            if isinstance(count, Exception):
+                output.append(f"❌ {model} model not accessible: {str(count)}")
+            else:
+                results[key] = True
+                output.append(f"✅ {model} model accessible ({count} {model.rsplit('.', 1)[1]}s found)")
         
     except Exception as e:
-        print(f"❌ Error testing models: {str(e)}")
+        output.append(f"❌ Error testing models: {str(e)}")
     
     return results
 
 
+def load_json(path: str) -> Any:
+    """Load a JSON file, with orjson if it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def dump_json(data: Any, path: str, pretty: bool = False):
+    """
+    Write data to a JSON file, with orjson if it is installed.
+    
+    Args:
+        data: Data to write
+        path: Path of the file
+        pretty: Indent the output instead of writing it compactly
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
+    with open(path, 'w') as f:
+        if pretty:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(',', ':'))
+
+
+def get_cache_path(conf: Dict[str, Any]) -> str:
+    """Return the cache file of an instance, named after a hash of its URL, database and user."""
+    identity = [conf.get('url'), conf.get('database'), conf.get('username')]
+    key = hashlib.sha256(json.dumps(identity).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f'{key}.json')
+
+
+def load_cached_result(conf: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Load the result of an earlier successful test of an instance.
+    
+    Returns:
+        The cached result, or None if there is none younger than CACHE_TTL
+    """
+    path = get_cache_path(conf)
+    try:
+        if time.time() - os.path.getmtime(path) >= CACHE_TTL:
+            return None
+        return load_json(path)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_result(conf: Dict[str, Any], models: dict, output: List[str]):
+    """Cache the result of a successful test of an instance; failures to write are ignored."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        dump_json({'models': models, 'output': output}, get_cache_path(conf))
+    except OSError:
+        pass
+
+
+def discard_cached_result(conf: Dict[str, Any]):
+    """Remove the cached result of an instance, if there is one."""
+    try:
+        os.remove(get_cache_path(conf))
+    except OSError:
+        pass
+
+
+async def test_instance(label: str, version: str, conf: Dict[str, Any],
+                        reuse_recent: bool = False) -> Tuple[str, dict, List[str]]:
+    """
+    Test the connection and the website models of one instance.
+    
+    The report lines are collected instead of printed, so two instances tested
+    at the same time don't interleave their output. With ``reuse_recent``, an
+    instance whose last test passed less than CACHE_TTL seconds ago isn't tested
+    again; its earlier report is reused. Every test updates that last result.
+    
+    Args:
+        label: 'Source' or 'Target'
+        version: Expected Odoo version, for the report headings
+        conf: Connection settings of the instance
+        reuse_recent: Reuse the report of a recent successful test
+        
+    Returns:
+        Tuple of (connection status, model test results, report lines)
+    """
+    loop = asyncio.get_running_loop()
+    output = [f"\n🔍 Testing {label} Connection (Odoo {version})", "-" * 40]
+    
+    cached = load_cached_result(conf) if reuse_recent else None
+    if cached is not None:
+        output.append("♻️  Reusing a recent successful test (run without --reuse-recent to test again)")
+        return CONNECTION_OK, cached['models'], output + cached['output']
+    
+    session = OdooSession(conf['url'], conf['database'], conf['username'], conf['password'])
+    
+    status = await loop.run_in_executor(None, test_odoo_connection, session, output)
+    
+    models = {}
+    if status == CONNECTION_OK:
+        output.append(f"\n🔍 Testing {label} Website Models")
+        output.append("-" * 40)
+        models = await test_website_models(session, output)
+    
+    if status == CONNECTION_OK and all(models.values()):
+        # Everything after the connection heading, which is added again on reuse
+        save_cached_result(conf, models, output[2:])
+    else:
+        # A later --reuse-recent run mustn't report an earlier success
+        discard_cached_result(conf)
+    
+    return status, models, output
+
+
+async def test_instances(config: Dict[str, Any], reuse_recent: bool = False) -> List[Tuple[str, dict, List[str]]]:
+    """
+    Test the source and target instances concurrently.
+    
+    The blocking JSON-RPC calls run on a pool with a thread for every model probe
+    of both instances, so they all overlap even where the default executor would
+    be smaller (it is sized after the CPU count).
+    
+    Args:
+        config: Configuration with the 'source' and 'target' connection settings
+        reuse_recent: Reuse the reports of recent successful tests
+    """
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2 * len(WEBSITE_MODELS)))
+    return await asyncio.gather(
+        test_instance('Source', '16', config['source'], reuse_recent),
+        test_instance('Target', '18', config['target'], reuse_recent)
+    )
+
+
+def write_lines(lines: List[str]):
+    """Write report lines to stdout with a single write."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+
 def main():
     """Main test function."""
-    print("Odoo Website Migrator - Connection Test")
-    print("=" * 50)
+    parser = argparse.ArgumentParser(description='Test the connections of the Odoo Website Migrator')
+    parser.add_argument('--reuse-recent', action='store_true',
+                        help='Reuse the result of an instance that passed all tests in the last '
+                             f'{CACHE_TTL} seconds instead of testing it again; results are '
+                             'matched by URL, database and username, not by password')
+    args = parser.parse_args()
+    
+    # Every section of the report is written to stdout at once, which is faster
+    # than a print call per line when the output goes to a log file or a pipe
+    lines = ["Odoo Website Migrator - Connection Test", "=" * 50]
     
     # Load configuration if available
     config = None
     try:
-        with open('config.json', 'r') as f:
-            config = json.load(f)
-        print("📁 Configuration file loaded")
+        config = load_json('config.json')
+        lines.append("📁 Configuration file loaded")
     except FileNotFoundError:
-        print("⚠️  No config.json found, using default test values")
+        lines.append("⚠️  No config.json found, using default test values")
         config = {
             'source': {
                 'url': 'http://localhost:8069',
@@ -169,79 +436,64 @@ def main():
                 'password': 'admin'
             }
         }
+    write_lines(lines)
     
-    # Test source connection
-    print("\n🔍 Testing Source Connection (Odoo 16)")
-    print("-" * 40)
-    source_ok = test_odoo_connection(
-        config['source']['url'],
-        config['source']['database'],
-        config['source']['username'],
-        config['source']['password']
-    )
+    # Test both instances at the same time, then report them one after the other
+    (source_status, source_models, source_output), (target_status, target_models, target_output) = \
+        asyncio.run(test_instances(config, reuse_recent=args.reuse_recent))
+    source_ok = source_status == CONNECTION_OK
+    target_ok = target_status == CONNECTION_OK
     
-    if source_ok:
-        print("\n🔍 Testing Source Website Models")
-        print("-" * 40)
-        source_models = test_website_models(
-            config['source']['url'],
-            config['source']['database'],
-            config['source']['username'],
-            config['source']['password']
-        )
-    
-    # Test target connection
-    print("\n🔍 Testing Target Connection (Odoo 18)")
-    print("-" * 40)
-    target_ok = test_odoo_connection(
-        config['target']['url'],
-        config['target']['database'],
-        config['target']['username'],
-        config['target']['password']
-    )
-    
-    if target_ok:
-        print("\n🔍 Testing Target Website Models")
-        print("-" * 40)
-        target_models = test_website_models(
-            config['target']['url'],
-            config['target']['database'],
-            config['target']['username'],
-            config['target']['password']
-        )
+    lines = source_output + target_output
     
     # Summary
-    print("\n📊 Test Summary")
-    print("=" * 50)
-    print(f"Source Connection: {'✅ OK' if source_ok else '❌ FAILED'}")
-    print(f"Target Connection: {'✅ OK' if target_ok else '❌ FAILED'}")
+    lines.append("\n📊 Test Summary")
+    lines.append("=" * 50)
+    lines.append(f"Source Connection: {'✅ OK' if source_ok else f'❌ FAILED ({source_status})'}")
+    lines.append(f"Target Connection: {'✅ OK' if target_ok else f'❌ FAILED ({target_status})'}")
     
     if source_ok and target_ok:
-        print("\n🎉 All connections successful! You can proceed with migration.")
-        print("\nTo run the migration:")
-        print("1. Using config file: python odoo_migrator_enhanced.py --config config.json")
-        print("2. Using command line: python odoo_migrator_enhanced.py --source-url ... --target-url ...")
+        lines.append("\n🎉 All connections successful! You can proceed with migration.")
+        lines.append("\nTo run the migration:")
+        lines.append("1. Using config file: python odoo_migrator_enhanced.py --config config.json")
+        lines.append("2. Using command line: python odoo_migrator_enhanced.py --source-url ... --target-url ...")
     else:
-        print("\n❌ Some connections failed. Please check your configuration and try again.")
-        print("\nCommon issues:")
-        print("- Verify Odoo instances are running")
-        print("- Check URLs and database names")
-        print("- Ensure XML-RPC is enabled")
-        print("- Verify username and password")
+        lines.append("\n❌ Some connections failed. Please check your configuration and try again.")
+        lines.append("\nCommon issues:")
+        statuses = {source_status, target_status}
+        if CONNECTION_UNREACHABLE in statuses:
+            lines.append("- Verify Odoo instances are running")
+            lines.append("- Check URLs, DNS and SSL settings")
+            lines.append("- Ensure the /jsonrpc endpoint is reachable (not blocked by a proxy)")
+        if CONNECTION_ERROR in statuses:
+            lines.append("- Check database names")
+        if CONNECTION_AUTH_FAILED in statuses:
+            lines.append("- Verify username and password")
+    
+    write_lines(lines)
     
     # Save test results
     test_results = {
         'timestamp': datetime.now().isoformat(),
         'source_connection': source_ok,
         'target_connection': target_ok,
+        'source_status': source_status,
+        'target_status': target_status,
         'source_models': source_models if source_ok else {},
         'target_models': target_models if target_ok else {}
     }
     
-    with open('test_results.json', 'w') as f:
-        json.dump(test_results, f, indent=2)
+    # The results file is meant for scripts, so it is written compactly; set
+    # PRETTY=1 for an indented copy to read
+    dump_json(test_results, 'test_results.json')
+    
+    lines = ["\n📄 Test results saved to: test_results.json"]
+    
+    if os.environ.get('PRETTY') == '1':
+        dump_json(test_results, 'test_results.pretty.json', pretty=True)
+        lines.append("📄 Readable copy saved to: test_results.pretty.json")
     
-    print(f"\n📄 Test results saved to: test_results.json")
+    write_lines(lines)
 
 
 if __name__ == '__main__':